@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from copy import deepcopy
+import json
+import logging
+import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 try:
     import yaml
@@ -13,6 +17,9 @@ except ImportError as exc:  # pragma: no cover - environment specific
         "Install it with `pip install pyyaml`."
     ) from exc
 
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _config_target_path() -> Path:
     """Return a writable config path that survives PyInstaller onefile.
@@ -27,7 +34,19 @@ def _config_target_path() -> Path:
     return Path(__file__).resolve().with_name("config.yaml")
 
 
-CONFIG_PATH = _config_target_path()
+_CONFIG_PATH: Path | None = None
+
+
+def config_path() -> Path:
+    """Return the default config path, resolving it on first use."""
+    global _CONFIG_PATH
+    if _CONFIG_PATH is None:
+        _CONFIG_PATH = _config_target_path()
+    return _CONFIG_PATH
+
+
+# Parsed configs keyed by path, validated against the file's mtime and size.
+_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
 
 
 def _default_config() -> Dict[str, Any]:
@@ -47,41 +66,130 @@ def _default_config() -> Dict[str, Any]:
     }
 
 
+_DEFAULT_CONFIG = _default_config()
+
+
+def _sidecar_path(target: Path) -> Path:
+    """Return the JSON cache that shadows the given YAML file."""
+    return target.with_name(f"{target.name}.cache")
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    """Write ``data`` to a uniquely named temporary sibling, then rename it over ``target``.
+
+    The unique name keeps two running instances from clobbering each
+    other's half-written file.
+    """
+    fh = tempfile.NamedTemporaryFile(dir=target.parent, prefix=f"{target.name}.", suffix=".tmp", delete=False)
+    try:
+        with fh:
+            fh.write(data)
+        os.replace(fh.name, target)
+    except BaseException:
+        Path(fh.name).unlink(missing_ok=True)
+        raise
+
+
+def _merge_defaults(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the default configuration with ``raw`` merged on top.
+
+    The result shares objects with the module-level defaults and must be
+    copied before it is handed to callers that may mutate it.
+    """
+    # Shallow merge on top-level sections to keep future compatibility simple.
+    config = {
+        key: {**default, **raw[key]} if isinstance(raw.get(key), dict) else raw.get(key, default)
+        for key, default in _DEFAULT_CONFIG.items()
+    }
+    config.update({key: value for key, value in raw.items() if key not in config})
+    return config
+
+
+def _read_sidecar(target: Path, stat: os.stat_result) -> Dict[str, Any] | None:
+    """Return the cached config if it is at least as new as the YAML file.
+
+    A sidecar that cannot be read back (truncated, corrupt, or written by
+    an older version) is ignored so the YAML is parsed instead.
+    """
+    sidecar = _sidecar_path(target)
+    try:
+        if sidecar.stat().st_mtime_ns < stat.st_mtime_ns:
+            return None
+        config = json.loads(sidecar.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logging.getLogger(__name__).warning("Ignoring unreadable config cache %s", sidecar, exc_info=True)
+        return None
+
+    if not isinstance(config, dict):
+        logging.getLogger(__name__).warning("Ignoring config cache %s with unexpected contents", sidecar)
+        return None
+    return config
+
+
+def _write_sidecar(target: Path, config: Dict[str, Any]) -> None:
+    """Cache the merged config next to the YAML file, if possible.
+
+    This is best-effort: a read-only install directory, or a config that
+    JSON cannot reproduce exactly (e.g. YAML dates or non-string keys),
+    simply leaves the YAML to be parsed on the next launch.
+    """
+    sidecar = _sidecar_path(target)
+    try:
+        text = json.dumps(config, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return
+    if json.loads(text) != config:
+        return
+
+    try:
+        _write_atomic(sidecar, text.encode("utf-8"))
+    except OSError:
+        logging.getLogger(__name__).warning("Could not write config cache %s", sidecar, exc_info=True)
+
+
 def load_config(path: Path | None = None) -> Dict[str, Any]:
-    """Load configuration from YAML, falling back to defaults if missing/empty."""
-    target = Path(path) if path is not None else CONFIG_PATH
+    """Load configuration from YAML, falling back to defaults if missing/empty.
+
+    The merged result is cached as JSON next to the YAML file so later
+    launches skip YAML parsing until the file is edited again.
+    """
+    target = Path(path) if path is not None else config_path()
 
     if not target.exists():
         return _default_config()
 
-    with target.open("r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh) or {}
+    stat = target.stat()
+    cached = _CACHE.get(target)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return deepcopy(cached[2])
 
-    config = _default_config()
+    config = _read_sidecar(target, stat)
+    if config is None:
+        with target.open("r", encoding="utf-8") as fh:
+            raw = yaml.load(fh, Loader=_Loader) or {}
 
-    # Shallow merge on top-level sections to keep future compatibility simple.
-    for key, value in raw.items():
-        if isinstance(value, dict) and key in config and isinstance(config[key], dict):
-            config[key].update(value)
-        else:
-            config[key] = value
+        config = _merge_defaults(raw)
+        _write_sidecar(target, config)
 
-    return config
+    _CACHE[target] = (stat.st_mtime_ns, stat.st_size, config)
+    return deepcopy(config)
 
 
 def save_config(config: Dict[str, Any], path: Path | None = None) -> None:
-    """Persist configuration to YAML."""
-    target = Path(path) if path is not None else CONFIG_PATH
+    """Persist configuration to YAML. The mapping is dumped as-is, not copied."""
+    target = Path(path) if path is not None else config_path()
     # Make sure parent exists in case the project is relocated.
     target.parent.mkdir(parents=True, exist_ok=True)
 
-    # Work with a copy to avoid accidental mutation while dumping.
-    data = deepcopy(config)
+    text = yaml.dump(
+        config,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    _write_atomic(target, text.encode("utf-8"))
+    _write_sidecar(target, _merge_defaults(config))
 
-    with target.open("w", encoding="utf-8") as fh:
-        yaml.safe_dump(
-            data,
-            fh,
-            default_flow_style=False,
-            sort_keys=False,
-        )
+    _CACHE.pop(target, None)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import logging
 from typing import List
-import sounddevice as sd
 
 
 def list_input_devices() -> List[str]:
@@ -12,10 +12,19 @@ def list_input_devices() -> List[str]:
     an empty list is returned so the rest of the application can
     continue to function.
     """
-    devices_info = sd.query_devices()
+    try:
+        import sounddevice as sd
+    except ImportError:
+        return []
 
-    names: List[str] = []
-    seen: set[str] = set()
+    try:
+        devices_info = sd.query_devices()
+    except Exception:
+        logging.getLogger(__name__).exception("Audio input device enumeration failed")
+        return []
+
+    # Device names in order of first appearance; dict keys deduplicate.
+    names: dict[str, None] = {}
 
     for info in devices_info:
         # Only keep devices that can record audio.
@@ -23,13 +32,7 @@ def list_input_devices() -> List[str]:
             continue
 
         name = info.get("name")
-        if not name or not isinstance(name, str):
-            continue
-
-        if name in seen:
-            continue
-
-        seen.add(name)
-        names.append(name)
+        if name and isinstance(name, str):
+            names[name] = None
 
-    return names
+    return list(names)
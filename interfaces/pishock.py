@@ -1,12 +1,27 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
-import pishock
+from typing import Callable, Optional, TYPE_CHECKING
 import logging
+import queue
+import threading
+import time
 
 if TYPE_CHECKING:
+    import pishock
     from interfaces.vrchatosc import VRChatOSCInterface
 
+# OSC parameter value for each integer shock strength (0-100).
+_STRENGTH_TO_OSC = tuple(strength / 100.0 for strength in range(101))
+
+# A queued shocker call: (queued at, bound action, log label, strength,
+# duration, mirror to OSC).
+_PendingSend = tuple[float, Callable[..., object], str, int, float, bool]
+
+# Sends waiting behind a slow API call are capped in number and dropped once
+# stale, so a backlog never turns into a late burst of shocks.
+_MAX_PENDING_SENDS = 4
+_MAX_SEND_AGE = 1.0
+
 
 class PiShockInterface:
     """Interface wrapper around the PiShock API.
@@ -36,54 +51,50 @@ class PiShockInterface:
         self.share_code: Optional[str] = share_code
         self.shocker_id: Optional[str] = shocker_id
         self._osc: Optional["VRChatOSCInterface"] = osc
+        self._osc_pulse: Optional[Callable[..., None]] = osc.pulse_parameter if osc is not None else None
 
         self.logger = logging.getLogger(__name__)
 
         self._connected: bool = False
         self._api: Optional[pishock.PiShockAPI | pishock.SerialAPI] = None
         self._shocker: Optional[pishock.HTTPShocker | pishock.SerialShocker] = None
+        self._shock: Optional[Callable[..., object]] = None
+        self._vibrate: Optional[Callable[..., object]] = None
         self._api_mode: str = "serial"
 
-    def start(self) -> None:
-        """Initialise the PiShock API client and validate credentials."""
-
-        try_online = True
-
-        try:
-            if self.shocker_id == "":
-                self.logger.info("PiShock no shocker ID")
-
-            api = pishock.SerialAPI(port=None)
-            self.logger.info(api.info())
+        # Pending sends, run in order on one sender thread per connection so
+        # callers never wait on HTTP or serial I/O. ``None`` tells the sender
+        # to exit.
+        self._outbox: Optional[queue.Queue[Optional[_PendingSend]]] = None
 
-            self._shocker = api.shocker(int(self.shocker_id))
+        self._has_online_creds: bool = bool(username and api_key and share_code)
+        self._shocker_id_int: Optional[int] = self._parse_shocker_id(shocker_id)
 
-            try_online = False
-        except pishock.zap.serialapi.SerialAutodetectError:
-            self.logger.info("No serial connection")
-
-        if try_online:
-            if self.username == "" or self.api_key == "" or self.share_code == "":
-                self._connected = False
-                self._api = None
-                self._shocker = None
-                self.logger.info("PiShock no login details")
-                return
+    def start(self) -> None:
+        """Initialise the PiShock API client and validate credentials."""
+        self._stop_sender()
 
-            api = pishock.PiShockAPI(username=self.username, api_key=self.api_key)
+        connection = None
+        if self._shocker_id_int is not None:
+            connection = self._start_serial()
+        else:
+            self.logger.info("PiShock no shocker ID")
 
-            if not api.verify_credentials():
-                self._connected = False
-                self._api = None
-                self._shocker = None
-                self.logger.info("PiShock verify fail")
-                return
+        if connection is None:
+            connection = self._start_online()
 
-            self._shocker = api.shocker(self.share_code)
+        if connection is None:
+            self.stop()
+            return
 
-        self._api = api
+        self._api, self._shocker = connection
+        self._shock = self._shocker.shock
+        self._vibrate = self._shocker.vibrate
         self._connected = True
 
+        self._outbox = queue.Queue(maxsize=_MAX_PENDING_SENDS)
+        threading.Thread(target=self._run_sender, args=(self._outbox,), name="PiShockSender", daemon=True).start()
+
         self._shocker.vibrate(duration=1, intensity=100)
 
         self.logger.info("PiShock verify success")
@@ -91,8 +102,11 @@ class PiShockInterface:
     def stop(self) -> None:
         """Tear down connection or cleanup resources."""
         self._connected = False
+        self._stop_sender()
         self._api = None
         self._shocker = None
+        self._shock = None
+        self._vibrate = None
 
     @property
     def is_connected(self) -> bool:
@@ -110,27 +124,7 @@ class PiShockInterface:
             duration: Shock duration in seconds. Can be a float in the
                 0-1 range or an integer 0–15 for whole seconds.
         """
-        self.logger.info("PiShock sending shock start")
-
-        if not self._connected:
-            self.logger.info("PiShock not connected")
-            return
-
-        shocker = self._shocker
-        if shocker is None:
-            self.logger.info("PiShock no shocker")
-            return
-
-        safe_strength = max(0, min(100, int(strength)))
-        safe_duration = max(0.0,  min(15.0, float(duration)))
-
-        self._send_shock_osc(strength=safe_strength, duration=1)
-
-        try:
-            shocker.shock(duration=safe_duration, intensity=safe_strength)
-            self.logger.info("PiShock sending shock done")
-        except Exception as exc:
-            self.logger.info(f"PiShock sending shock failed: {exc}")
+        self._send(self._shock, "shock", strength, duration, mirror_osc=True)
 
     def send_vibrate(
         self,
@@ -144,35 +138,131 @@ class PiShockInterface:
             duration: Vibration duration in seconds. Can be a float in the
                 0-1 range or an integer 0–15 for whole seconds.
         """
-        self.logger.info("PiShock sending vibration start")
+        self._send(self._vibrate, "vibration", strength, duration)
+
+    # Internal helpers -------------------------------------------------
+    def _parse_shocker_id(self, shocker_id: Optional[str]) -> Optional[int]:
+        """Return the serial shocker id as an int, or None if unset/invalid."""
+        if not shocker_id:
+            return None
+
+        try:
+            return int(shocker_id)
+        except ValueError:
+            self.logger.info(f"PiShock invalid shocker ID: {shocker_id!r}")
+            return None
+
+    def _start_serial(self) -> tuple[pishock.SerialAPI, pishock.SerialShocker] | None:
+        """Connect to a locally attached PiShock hub over serial."""
+        import pishock
+        from pishock.zap.serialapi import SerialAutodetectError
+
+        try:
+            api = pishock.SerialAPI(port=None)
+            self.logger.info(api.info())
+            shocker = api.shocker(self._shocker_id_int)
+        except SerialAutodetectError:
+            self.logger.info("No serial connection")
+            return None
+
+        self._api_mode = "serial"
+        return api, shocker
+
+    def _start_online(self) -> tuple[pishock.PiShockAPI, pishock.HTTPShocker] | None:
+        """Connect through the PiShock web API using the share code."""
+        import pishock
+
+        if not self._has_online_creds:
+            self.logger.info("PiShock no login details")
+            return None
+
+        api = pishock.PiShockAPI(username=self.username, api_key=self.api_key)
+
+        if not api.verify_credentials():
+            self.logger.info("PiShock verify fail")
+            return None
+
+        self._api_mode = "online"
+        return api, api.shocker(self.share_code)
+
+    def _send(
+        self,
+        action: Optional[Callable[..., object]],
+        label: str,
+        strength: int,
+        duration: float,
+        *,
+        mirror_osc: bool = False,
+    ) -> None:
+        """Clamp the parameters and run a bound shocker ``action``."""
+        self.logger.debug("PiShock sending %s start", label)
 
         if not self._connected:
-            self.logger.info("PiShock not connected")
+            self.logger.debug("PiShock not connected")
             return
 
-        shocker = self._shocker
-        if shocker is None:
-            self.logger.info("PiShock no shocker")
+        outbox = self._outbox
+        if action is None or outbox is None:
+            self.logger.debug("PiShock no shocker")
             return
 
-        safe_strength = max(0, min(100, int(strength)))
-        safe_duration = max(0.0,  min(15.0, float(duration)))
+        strength = int(strength)
+        safe_strength = 0 if strength < 0 else 100 if strength > 100 else strength
+        duration = float(duration)
+        safe_duration = 0.0 if duration < 0.0 else 15.0 if duration > 15.0 else duration
 
         try:
-            shocker.vibrate(duration=safe_duration, intensity=safe_strength)
-            self.logger.info("PiShock sending vibration done")
-        except Exception as exc:
-            self.logger.info(f"PiShock sending vibration failed: {exc}")
+            outbox.put_nowait((time.monotonic(), action, label, safe_strength, safe_duration, mirror_osc))
+        except queue.Full:
+            self.logger.warning("PiShock %s dropped: earlier sends are still pending", label)
+
+    def _stop_sender(self) -> None:
+        """Discard pending sends and tell the current sender thread to exit."""
+        outbox = self._outbox
+        self._outbox = None
+        if outbox is None:
+            return
+
+        while True:
+            try:
+                outbox.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                outbox.put_nowait(None)
+                return
+            except queue.Full:
+                continue
+
+    def _run_sender(self, outbox: queue.Queue[Optional[_PendingSend]]) -> None:
+        """Run queued shocker actions until the exit marker arrives."""
+        while (item := outbox.get()) is not None:
+            queued_at, action, label, strength, duration, mirror_osc = item
+            if time.monotonic() - queued_at > _MAX_SEND_AGE:
+                self.logger.warning("PiShock %s dropped: queued too long", label)
+                continue
+
+            # Mirror right before the real send so the avatar stays in step.
+            if mirror_osc:
+                self._send_shock_osc(strength=strength, duration=1)
+
+            try:
+                action(duration=duration, intensity=strength)
+                self.logger.debug("PiShock sending %s done", label)
+            except Exception:
+                self.logger.exception("PiShock sending %s failed", label)
 
-    # Internal helpers -------------------------------------------------
     def _send_shock_osc(self, strength: int, duration: float) -> None:
-        """Send OSC parameters for the given shock """
-        # Normalise strength (0–100) to a 0–1 float for OSC.
-        value = max(0.0, min(1.0, float(strength) / 100.0))
+        """Send OSC parameters for the given shock.
+
+        ``strength`` must already be clamped to an integer in 0-100.
+        """
+        if self._osc_pulse is None:
+            return
 
-        self._osc.pulse_parameter(
+        self._osc_pulse(
             "Trainer/BeingShocked",
-            value_on=value,
+            value_on=_STRENGTH_TO_OSC[strength],
             value_off=0.0,
             duration=duration,
         )
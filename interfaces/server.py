@@ -1,16 +1,78 @@
 from __future__ import annotations
 
-from typing import Any, Callable, MutableMapping, Optional, Iterable
+from typing import Any, Callable, Mapping, MutableMapping, Optional, Iterable
 import time
-from collections import deque
+from collections import OrderedDict, deque
 import uuid
 import logging
 import threading
 import json
-import queue
+import random
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
 import websocket
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Prefer orjson's C encoder for websocket frames; the stdlib json is a fallback.
+_dumps: Callable[[Any], str | bytes] = orjson.dumps if orjson is not None else json.dumps
+_loads: Callable[[str | bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Shared read-only fallback for missing event sections, so lookups on events
+# without a payload or meta block do not allocate a fresh dict each time.
+_EMPTY: MappingProxyType = MappingProxyType({})
+
+# Formatted timestamps keyed by whole epoch second; strftime is only re-run
+# once the second rolls over.
+_iso_cache: tuple[int, str] = (-1, "")
+_clock_cache: tuple[int, str] = (-1, "")
+
+
+def _utcnow_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string with second precision."""
+
+    global _iso_cache
+    now = int(time.time())
+    # Read the shared tuple once: another thread may replace it at any time.
+    cached_second, text = _iso_cache
+    if cached_second != now:
+        text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _iso_cache = (now, text)
+    return text
+
+
+def _local_clock() -> str:
+    """Return the current local time as ``HH:MM:SS`` for event log lines."""
+
+    global _clock_cache
+    now = int(time.time())
+    cached_second, text = _clock_cache
+    if cached_second != now:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        _clock_cache = (now, text)
+    return text
+
+
+# Telemetry event types that never produce an event log line.
+_SILENT_TYPES = frozenset({"status", "logs"})
+
+
+def _format_command_event(evt: dict[str, Any]) -> str:
+    phrase = (evt.get("payload") or _EMPTY).get("command")
+    if not phrase:
+        return "command"
+    return f"{evt.get('from_client', '-')[:8]} command: {phrase}"
+
+
+_EVENT_FORMATTERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "command": _format_command_event,
+    "config": lambda _evt: "config updated",
+}
+
 
 class RemoteServerInterface:
     """HTTP client for the hosted vrtrainer.online API.
@@ -32,32 +94,70 @@ class RemoteServerInterface:
         self._username = username.strip() or "Anonymous"
         self._log = log or logging.getLogger(__name__).debug
         self._timeout = timeout
+        # Keep-alive pool so the periodic roster refresh reuses TCP/TLS state.
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self._http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
         self._client_uuid = uuid.uuid4()
+        self._client_uuid_str = str(self._client_uuid)
+        # Encoded '{"type": ..., "from_client": ...,' heads for outgoing frames;
+        # only the per-message fields are serialized on send.
+        self._frame_prefix = {
+            frame_type: self._encode_frame_prefix(frame_type)
+            for frame_type in ("config", "command", "logs", "status")
+        }
         self._connected = False
         self._session_id: str | None = None
         self._session_state: str = "idle"
         self._latest_settings: dict[str, Any] = {}
+        # Replaced wholesale (never mutated in place) under _settings_lock, so
+        # readers on other threads can iterate whatever snapshot they hold.
         self._latest_settings_by_trainer: dict[str, dict[str, Any]] = {}
+        # Read-only view of the above, rebuilt by the writer on every change.
+        self._latest_settings_by_trainer_view: Mapping[str, Mapping[str, Any]] = _EMPTY
+        self._settings_lock = threading.Lock()
+        # Called (with no arguments) whenever the per-trainer settings change.
+        self._settings_listeners: list[Callable[[], None]] = []
+        # Called (with no arguments) when an event is queued for that feature.
+        self._feature_event_listeners: dict[str, list[Callable[[], None]]] = {}
         self._session_users: list[dict[str, Any]] = []
-        self._events: list[str] = []
+        # Trainer client ids from the roster, recomputed when it is replaced.
+        self._trainer_ids: tuple[str, ...] = ()
+        self._events: deque[str] = deque(maxlen=50)
         self._last_event_id: str | None = None
         self._last_session_refresh: float = 0.0
         # Track processed server event ids to avoid duplicate log spam when polling
         # and when periodically refreshing session details.
-        self._seen_event_ids: deque[str] = deque(maxlen=200)
-        self._seen_event_ids_set: set[str] = set()
+        self._seen_event_ids: OrderedDict[str, None] = OrderedDict()
         self._stats_by_user: dict[str, list[dict[str, Any]]] = {}
+        # Read-only copies of the collections exposed by get_session_details,
+        # rebuilt only after one of them changes.
+        self._details_cache: dict[str, Any] = {}
+        self._details_dirty = True
         self._ws: websocket.WebSocketApp | None = None
         self._ws_thread: threading.Thread | None = None
+        # Stop flag of the current connection. Each connection gets a fresh
+        # event so threads from an earlier one that outlive their join
+        # timeout still see their own stop.
         self._ws_stop = threading.Event()
-        self._incoming: "queue.Queue[dict[str, Any]]" = queue.Queue()
+        # Reconnect delay in seconds; doubles per failed attempt, reset on open.
+        self._ws_backoff = 0.5
+        # Raw frames handed from the websocket reader to the decode worker;
+        # also replaced per connection.
+        self._raw_in: deque[str | bytes] = deque()
+        self._raw_ready = threading.Event()
+        self._decode_thread: threading.Thread | None = None
+        self._roster_thread: threading.Thread | None = None
+        self._incoming: deque[dict[str, Any]] = deque()
         # Preserve events that were not consumed by a predicate so other
         # features can still process them.
         self._pending_events: deque[dict[str, Any]] = deque()
-        # Per-feature event buffers to avoid cross-consumption between
-        # independent pet features.
-        self._feature_queues: dict[str, deque[dict[str, Any]]] = {}
+        # Per-feature event buffers, split by sending trainer, to avoid
+        # cross-consumption between independent pet features and trainers.
+        self._feature_queues: dict[str, dict[str, deque[dict[str, Any]]]] = {}
+        # Raw feature names seen on the wire mapped to their normalized key.
+        self._known_features: dict[str, str] = {}
 
     # Internal connection state helpers ----------------------------
     def _mark_disconnected(self, reason: str | None = None) -> None:
@@ -73,7 +173,7 @@ class RemoteServerInterface:
     def start(self) -> None:
         """Mark as connected; performs a lightweight health probe."""
         try:
-            resp = requests.get(f"{self.base_url}/health", timeout=self._timeout)
+            resp = self._http.get(f"{self.base_url}/health", timeout=self._timeout)
             resp.raise_for_status()
             self._log("remote server reachable")
             self._connected = True
@@ -85,16 +185,18 @@ class RemoteServerInterface:
         self._connected = False
         self._session_id = None
         self._session_state = "idle"
-        self._session_users = []
-        self._events = []
+        self._set_session_users([])
+        self._events.clear()
         self._last_event_id = None
-        self._latest_settings_by_trainer = {}
+        self._replace_trainer_settings({})
+        self._notify_settings_changed()
         self._seen_event_ids.clear()
-        self._seen_event_ids_set.clear()
         self._stats_by_user = {}
+        self._details_dirty = True
         self._close_ws()
         self._pending_events.clear()
         self._feature_queues.clear()
+        self._http.close()
 
     def record_local_event(self, message: str) -> None:
         """Append a log line to the session event list without server IO."""
@@ -120,14 +222,14 @@ class RemoteServerInterface:
             return
 
         self._latest_settings = dict(settings)
+        self._details_dirty = True
         self._send_ws(
+            "config",
             {
-                "type": "config",
-                "from_client": str(self._client_uuid),
                 "target_scope": "per_client",
                 "target_client": str(target_client),
-                "payload": dict(settings),
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "payload": self._latest_settings,
+                "timestamp": _utcnow_iso(),
             }
         )
 
@@ -136,13 +238,12 @@ class RemoteServerInterface:
         meta = dict(metadata or {})
         payload = {"command": command, "meta": meta}
         self._send_ws(
+            "command",
             {
-                "type": "command",
-                "from_client": str(self._client_uuid),
                 "target_scope": "per_client" if meta.get("target_client") else "broadcast",
                 "target_client": meta.get("target_client"),
                 "payload": payload,
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "timestamp": _utcnow_iso(),
             }
         )
 
@@ -159,12 +260,6 @@ class RemoteServerInterface:
         fan out per-client messages to avoid server validation errors.
         """
 
-        # Keep roster reasonably fresh when we need to route logs.
-        try:
-            self._refresh_session_users()
-        except Exception:
-            pass
-
         broadcast_flag = bool(stats.pop("broadcast_trainers", False))
         if broadcast_trainers is not None:
             broadcast_flag = bool(broadcast_trainers)
@@ -179,7 +274,7 @@ class RemoteServerInterface:
 
         # Default to the first available trainer to retain previous behaviour.
         if not explicit_targets:
-            first_trainer = next(iter(self._trainer_client_ids()), None)
+            first_trainer = self._pick_trainer_target()
             if first_trainer:
                 explicit_targets.append(first_trainer)
 
@@ -189,28 +284,27 @@ class RemoteServerInterface:
         payload = dict(stats)
         payload.pop("target_client", None)
 
+        # The server has no multi-target scope, so build the frame once and
+        # only swap the recipient; _send_ws serializes it synchronously.
+        frame = {
+            "target_scope": "per_client",
+            "target_client": None,
+            "payload": payload,
+            "timestamp": _utcnow_iso(),
+        }
         for target_client in explicit_targets:
-            self._send_ws(
-                {
-                    "type": "logs",
-                    "from_client": str(self._client_uuid),
-                    "target_scope": "per_client",
-                    "target_client": target_client,
-                    "payload": payload,
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                }
-            )
+            frame["target_client"] = target_client
+            self._send_ws("logs", frame)
 
     def send_status(self, status: MutableMapping[str, Any]) -> None:
         """Status from OSC/whisper/pishock."""
         self._send_ws(
+            "status",
             {
-                "type": "status",
-                "from_client": str(self._client_uuid),
                 "target_scope": "broadcast",
                 "target_client": None,
-                "payload": dict(status),
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "payload": status,
+                "timestamp": _utcnow_iso(),
             }
         )
 
@@ -219,7 +313,7 @@ class RemoteServerInterface:
         session_id = (session_label or f"s-{uuid.uuid4().hex[:6]}").strip()
         payload = {
             "session_id": session_id,
-            "client_uuid": str(self._client_uuid),
+            "client_uuid": self._client_uuid_str,
             "role": role,
             "username": self._username,
         }
@@ -240,7 +334,7 @@ class RemoteServerInterface:
             raise ValueError("Session code cannot be empty")
 
         payload = {
-            "client_uuid": str(self._client_uuid),
+            "client_uuid": self._client_uuid_str,
             "role": role,
             "username": self._username,
         }
@@ -249,8 +343,8 @@ class RemoteServerInterface:
         self._session_state = "joined"
         participants = data.get("participants")
         if participants:
-            self._session_users = list(participants)
-            self._last_session_refresh = time.time()
+            self._set_session_users(participants)
+            self._last_session_refresh = time.monotonic()
         self._record_event_string(f"joined session {self._session_id}")
         self._connect_ws()
         return self.get_session_details()
@@ -258,36 +352,44 @@ class RemoteServerInterface:
     def leave_session(self) -> dict[str, Any]:
         if self._session_id:
             try:
-                self._post(f"/sessions/{self._session_id}/leave", {"client_uuid": str(self._client_uuid)})
+                self._post(f"/sessions/{self._session_id}/leave", {"client_uuid": self._client_uuid_str})
             except Exception:
                 pass
             self._record_event_string(f"left session {self._session_id}")
         self._close_ws()
         self._session_id = None
         self._session_state = "idle"
-        self._session_users = []
-        self._events = []
+        self._set_session_users([])
+        self._events.clear()
         self._last_event_id = None
-        self._latest_settings_by_trainer = {}
+        self._replace_trainer_settings({})
+        self._notify_settings_changed()
+        self._details_dirty = True
         self._pending_events.clear()
         return self.get_session_details()
 
     def get_session_details(self) -> dict[str, Any]:
-        # Opportunistically refresh roster data so the UI has pet identifiers.
-        try:
-            self._refresh_session_users()
-        except Exception:
-            pass
+        if self._details_dirty:
+            # Clear before reading: writers on other threads mutate first and
+            # then set the flag, so a change racing this rebuild is either
+            # captured here or re-marks the cache dirty for the next call.
+            self._details_dirty = False
+            self._details_cache = {
+                "latest_settings": MappingProxyType(dict(self._latest_settings)),
+                # list() copies the deque atomically; iterating it directly
+                # could race an append from the websocket thread.
+                "events": tuple(list(self._events)[-10:]),
+                "session_users": tuple(MappingProxyType(dict(u)) for u in self._session_users),
+                "stats_by_user": MappingProxyType({k: tuple(v) for k, v in self._stats_by_user.items()}),
+            }
 
+        # Fresh top-level dict: callers annotate it with role/participant data.
         return {
             "connected": self._connected,
             "username": self._username,
             "session_id": self._session_id,
             "state": self._session_state,
-            "latest_settings": dict(self._latest_settings),
-            "events": list(self._events[-10:]),
-            "session_users": [dict(u) for u in self._session_users],
-            "stats_by_user": {k: list(v) for k, v in self._stats_by_user.items()},
+            **self._details_cache,
         }
 
     def set_username(self, username: str) -> None:
@@ -297,7 +399,7 @@ class RemoteServerInterface:
             try:
                 self._post(
                     f"/sessions/{self._session_id}/username",
-                    {"client_uuid": str(self._client_uuid), "username": self._username},
+                    {"client_uuid": self._client_uuid_str, "username": self._username},
                 )
             except Exception as exc:
                 self._log(f"username update failed: {exc}")
@@ -319,8 +421,8 @@ class RemoteServerInterface:
                 evt = self._pending_events.popleft()
             else:
                 try:
-                    evt = self._incoming.get_nowait()
-                except queue.Empty:
+                    evt = self._incoming.popleft()
+                except IndexError:
                     break
 
             inspected += 1
@@ -339,14 +441,46 @@ class RemoteServerInterface:
         return self._latest_settings.get(key, default)
 
     @property
-    def latest_settings(self) -> dict[str, Any]:
-        return dict(self._latest_settings)
+    def latest_settings(self) -> Mapping[str, Any]:
+        return MappingProxyType(self._latest_settings)
 
     @property
-    def latest_settings_by_trainer(self) -> dict[str, dict[str, Any]]:
+    def latest_settings_by_trainer(self) -> Mapping[str, Mapping[str, Any]]:
         """Return the last config payload seen from every trainer in the session."""
 
-        return dict(self._latest_settings_by_trainer)
+        return self._latest_settings_by_trainer_view
+
+    def add_settings_listener(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` whenever :attr:`latest_settings_by_trainer` changes."""
+
+        self._settings_listeners.append(callback)
+
+    def remove_settings_listener(self, callback: Callable[[], None]) -> None:
+        try:
+            self._settings_listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def add_feature_event_listener(self, feature: str, callback: Callable[[], None]) -> None:
+        """Call ``callback`` whenever an event is queued for ``feature``."""
+
+        self._feature_event_listeners.setdefault(self._feature_key(feature), []).append(callback)
+
+    def remove_feature_event_listener(self, feature: str, callback: Callable[[], None]) -> None:
+        try:
+            self._feature_event_listeners.get(self._feature_key(feature), []).remove(callback)
+        except ValueError:
+            pass
+
+    def _notify_settings_changed(self) -> None:
+        self._notify(self._settings_listeners, "settings")
+
+    def _notify(self, listeners: Iterable[Callable[[], None]], kind: str) -> None:
+        for callback in tuple(listeners):
+            try:
+                callback()
+            except Exception as exc:
+                self._log(f"{kind} listener failed: {exc}")
 
     def trainer_client_ids(self) -> list[str]:
         """Public wrapper for the current trainer ids in the session roster."""
@@ -356,9 +490,29 @@ class RemoteServerInterface:
     def get_trainer_settings(self, trainer_client_id: str | None) -> dict[str, Any]:
         """Return the last config payload sent by the given trainer, if any."""
 
-        if trainer_client_id and trainer_client_id in self._latest_settings_by_trainer:
-            return dict(self._latest_settings_by_trainer[trainer_client_id])
-        return self.latest_settings
+        settings = self._latest_settings_by_trainer.get(trainer_client_id) if trainer_client_id else None
+        if settings is not None:
+            return dict(settings)
+        return dict(self._latest_settings)
+
+    def _store_trainer_settings(self, trainer_client_id: str, payload: dict[str, Any]) -> None:
+        """Record ``payload`` as the latest config sent by one trainer."""
+
+        with self._settings_lock:
+            settings = dict(self._latest_settings_by_trainer)
+            settings[trainer_client_id] = payload
+            self._publish_trainer_settings(settings)
+
+    def _replace_trainer_settings(self, settings: dict[str, dict[str, Any]]) -> None:
+        with self._settings_lock:
+            self._publish_trainer_settings(settings)
+
+    def _publish_trainer_settings(self, settings: dict[str, dict[str, Any]]) -> None:
+        # Caller holds _settings_lock; the dict and its view swap together.
+        self._latest_settings_by_trainer = settings
+        self._latest_settings_by_trainer_view = MappingProxyType(
+            {k: MappingProxyType(v) for k, v in settings.items()}
+        )
 
     # Internal helpers -----------------------------------------------
     def _capture_session(self, session: dict[str, Any]) -> None:
@@ -368,53 +522,65 @@ class RemoteServerInterface:
     def _record_event_string(self, message: str) -> None:
         if not message:
             return
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = _local_clock()
         self._events.append(f"[{timestamp}] {message}")
-        if len(self._events) > 50:
-            self._events = self._events[-50:]
+        self._details_dirty = True
 
     def _record_event(self, evt: dict[str, Any]) -> None:
         """Format and store a server event, ignoring duplicates by id."""
 
+        event_id = evt.get("id")
+        if event_id and self._mark_seen(str(event_id)):
+            return
+
         # WebSocket messages already filtered; keep a human-readable echo.
         message = self._format_event(evt)
         if message:
             self._record_event_string(message)
 
+    def _mark_seen(self, event_id: str) -> bool:
+        """Remember ``event_id`` and return whether it was already seen."""
+
+        seen = self._seen_event_ids
+        if event_id in seen:
+            seen.move_to_end(event_id)
+            return True
+        seen[event_id] = None
+        if len(seen) > 200:
+            seen.popitem(last=False)
+        return False
+
     def _format_event(self, evt: dict[str, Any]) -> str:
-        evt_type = (evt.get("type") or "").lower()
         error_msg = evt.get("error")
         if error_msg:
             return f"error: {error_msg}"
-        payload = evt.get("payload") or {}
-        if evt_type == "status":
-            return ""
-        if evt_type == "logs":
-            return ""
 
-        phrase = payload.get("command")
-        if evt_type == "command" and phrase:
-            return f"{evt.get('from_client', '-')[:8]} command: {phrase}"
-        if evt_type == "config":
-            return "config updated"
+        evt_type = (evt.get("type") or "").lower()
+        if evt_type in _SILENT_TYPES:
+            return ""
+        formatter = _EVENT_FORMATTERS.get(evt_type)
+        if formatter is not None:
+            return formatter(evt)
         return evt_type or "event"
 
     def _pick_trainer_target(self) -> str | None:
         """Return the first trainer client_uuid in the session roster, if any."""
 
-        for user in self._session_users:
-            if str(user.get("role", "")).lower() == "trainer":
-                client_id = user.get("client_uuid")
-                if client_id:
-                    return str(client_id)
-        return None
+        return self._trainer_ids[0] if self._trainer_ids else None
 
     def _trainer_client_ids(self) -> list[str]:
-        return [
+        return list(self._trainer_ids)
+
+    def _set_session_users(self, participants: Iterable[dict[str, Any]]) -> None:
+        """Replace the roster and recompute the derived trainer ids."""
+
+        self._session_users = list(participants)
+        self._trainer_ids = tuple(
             str(u.get("client_uuid"))
             for u in self._session_users
             if str(u.get("role", "")).lower() == "trainer" and u.get("client_uuid")
-        ]
+        )
+        self._details_dirty = True
 
     def _refresh_session_users(self, *, force: bool = False) -> None:
         """Fetch the latest session participant roster from the server."""
@@ -422,7 +588,7 @@ class RemoteServerInterface:
         if not self._session_id or not self._connected:
             return
 
-        now = time.time()
+        now = time.monotonic()
         if not force and now - self._last_session_refresh < 2.0:
             return
 
@@ -433,12 +599,12 @@ class RemoteServerInterface:
 
         participants = data.get("participants")
         if isinstance(participants, list):
-            self._session_users = list(participants)
+            self._set_session_users(participants)
             self._last_session_refresh = now
 
     def _get(self, path: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         try:
-            resp = requests.get(f"{self.base_url}{path}", params=params, timeout=self._timeout)
+            resp = self._http.get(f"{self.base_url}{path}", params=params, timeout=self._timeout)
             resp.raise_for_status()
             self._connected = True
             return resp.json()
@@ -448,7 +614,7 @@ class RemoteServerInterface:
 
     def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
         try:
-            resp = requests.post(f"{self.base_url}{path}", json=payload, timeout=self._timeout)
+            resp = self._http.post(f"{self.base_url}{path}", json=payload, timeout=self._timeout)
             resp.raise_for_status()
             self._connected = True
             return resp.json()
@@ -462,10 +628,11 @@ class RemoteServerInterface:
             return
 
         ws_url = self.base_url.replace("https://", "wss://").replace("http://", "ws://")
-        ws_url = f"{ws_url}/sessions/{self._session_id}/ws?client_uuid={self._client_uuid}"
+        ws_url = f"{ws_url}/sessions/{self._session_id}/ws?client_uuid={self._client_uuid_str}"
 
         def _on_open(_ws: websocket.WebSocketApp) -> None:
             self._connected = True
+            self._ws_backoff = 0.5
             self._record_event_string("ws connected")
 
         def _on_close(_ws: websocket.WebSocketApp, _code: int, _msg: str) -> None:
@@ -475,21 +642,17 @@ class RemoteServerInterface:
         def _on_error(_ws: websocket.WebSocketApp, err: Exception) -> None:
             self._log(f"ws error: {err}")
 
-        def _on_message(_ws: websocket.WebSocketApp, msg: str) -> None:
-            try:
-                data = json.loads(msg)
-                if data.get("type") == "config":
-                    payload = data.get("payload", {})
-                    self._latest_settings = payload
-                    from_client = str(data.get("from_client") or "")
-                    if from_client:
-                        self._latest_settings_by_trainer[from_client] = payload
-                self._route_incoming_event(data)
-            except Exception:
-                return
+        stop = self._ws_stop = threading.Event()
+        raw_in: deque[str | bytes] = deque()
+        raw_ready = threading.Event()
+        self._raw_in, self._raw_ready = raw_in, raw_ready
+
+        def _on_message(_ws: websocket.WebSocketApp, msg: str | bytes) -> None:
+            # Keep the reader loop tight; decoding happens on the worker.
+            raw_in.append(msg)
+            raw_ready.set()
 
-        self._ws_stop.clear()
-        self._ws = websocket.WebSocketApp(
+        ws = self._ws = websocket.WebSocketApp(
             ws_url,
             on_open=_on_open,
             on_close=_on_close,
@@ -498,21 +661,68 @@ class RemoteServerInterface:
         )
 
         def _run() -> None:
-            while not self._ws_stop.is_set():
+            while not stop.is_set():
                 try:
-                    self._ws.run_forever(ping_interval=20, ping_timeout=5)
+                    ws.run_forever(ping_interval=20, ping_timeout=5)
                 except Exception as exc:
                     self._log(f"ws run error: {exc}")
-                time.sleep(2)
+                delay = self._ws_backoff + random.random() * 0.25
+                self._ws_backoff = min(self._ws_backoff * 2, 30.0)
+                stop.wait(delay)
 
         self._ws_thread = threading.Thread(target=_run, name="vrtrainer-ws", daemon=True)
         self._ws_thread.start()
+        self._decode_thread = threading.Thread(
+            target=self._decode_loop, args=(stop, raw_in, raw_ready), name="vrtrainer-ws-decode", daemon=True
+        )
+        self._decode_thread.start()
+        self._roster_thread = threading.Thread(
+            target=self._roster_loop, args=(stop,), name="vrtrainer-roster", daemon=True
+        )
+        self._roster_thread.start()
+
+    def _decode_loop(self, stop: threading.Event, raw_in: deque[str | bytes], raw_ready: threading.Event) -> None:
+        while not stop.is_set():
+            if not raw_ready.wait(timeout=0.5):
+                continue
+            raw_ready.clear()
+            while raw_in and not stop.is_set():
+                self._handle_message(raw_in.popleft())
+
+    def _roster_loop(self, stop: threading.Event) -> None:
+        """Keep the session roster fresh so senders and the UI never block on it."""
+
+        while not stop.wait(timeout=2.0):
+            self._refresh_session_users()
+
+    def _handle_message(self, msg: str | bytes) -> None:
+        try:
+            data = _loads(msg)
+            if data.get("type") == "config":
+                payload = data.get("payload", {})
+                if not isinstance(payload, dict):
+                    raise ValueError(f"config payload is {type(payload).__name__}, not an object")
+                self._latest_settings = payload
+                self._details_dirty = True
+                from_client = str(data.get("from_client") or "")
+                if from_client:
+                    self._store_trainer_settings(from_client, payload)
+                    self._notify_settings_changed()
+            self._route_incoming_event(data)
+        except Exception as exc:
+            self._log(f"ws message dropped: {exc}")
+
+    def _encode_frame_prefix(self, frame_type: str) -> str | bytes:
+        head = _dumps({"type": frame_type, "from_client": self._client_uuid_str})
+        return head[:-1] + (b"," if isinstance(head, bytes) else ",")
+
+    def _send_ws(self, frame_type: str, fields: dict[str, Any]) -> None:
+        """Send a frame of ``frame_type``; ``fields`` must not be empty."""
 
-    def _send_ws(self, message: dict[str, Any]) -> None:
         if not self._ws or not self._connected:
             return
         try:
-            self._ws.send(json.dumps(message))
+            self._ws.send(self._frame_prefix[frame_type] + _dumps(fields)[1:])
         except Exception as exc:
             self._log(f"ws send failed: {exc}")
 
@@ -520,9 +730,13 @@ class RemoteServerInterface:
         """Stop websocket thread and close connection if active."""
 
         self._ws_stop.set()
+        self._raw_ready.set()
         ws, thread = self._ws, self._ws_thread
+        workers = (self._decode_thread, self._roster_thread)
         self._ws = None
         self._ws_thread = None
+        self._decode_thread = None
+        self._roster_thread = None
 
         if ws:
             try:
@@ -531,15 +745,18 @@ class RemoteServerInterface:
                 pass
         if thread and thread.is_alive():
             thread.join(timeout=1.0)
+        for worker in workers:
+            if worker and worker.is_alive():
+                worker.join(timeout=1.0)
+        self._raw_in.clear()
         self._feature_queues.clear()
 
     # Event routing --------------------------------------------------
     def _route_incoming_event(self, event: dict[str, Any]) -> None:
         """Fan out server events to per-feature queues and drop disabled ones."""
 
-        payload = event.get("payload") or {}
-        meta = payload.get("meta") or {}
-        feature = str(meta.get("feature") or "").lower().strip()
+        meta = (event.get("payload") or _EMPTY).get("meta") or _EMPTY
+        feature = self._feature_key(meta.get("feature") or "")
 
         if feature:
             trainer_id = str(event.get("from_client") or "")
@@ -548,19 +765,41 @@ class RemoteServerInterface:
                 # Drop immediately when the trainer has that feature disabled.
                 return
 
-            queue_ref = self._feature_queues.setdefault(feature, deque())
+            trainer_queues = self._feature_queues.get(feature)
+            if trainer_queues is None:
+                trainer_queues = self._feature_queues[feature] = {}
+            queue_ref = trainer_queues.get(trainer_id)
+            if queue_ref is None:
+                # Prevent unbounded growth; keep latest 200 events per trainer.
+                queue_ref = trainer_queues[trainer_id] = deque(maxlen=200)
             queue_ref.append(event)
-            # Prevent unbounded growth; keep latest 200 events per feature.
-            if len(queue_ref) > 200:
-                queue_ref.popleft()
+            listeners = self._feature_event_listeners.get(feature)
+            if listeners:
+                self._notify(listeners, f"{feature} event")
         else:
-            self._incoming.put(event)
+            self._incoming.append(event)
 
-        self._record_event(event)
+        # Telemetry dominates traffic and is never echoed unless it failed.
+        if event.get("type") not in _SILENT_TYPES or event.get("error"):
+            self._record_event(event)
+
+    def _feature_key(self, raw: Any) -> str:
+        """Return the normalized queue key for a feature name, memoized."""
+
+        if not isinstance(raw, str):
+            return str(raw).lower().strip()
+        key = self._known_features.get(raw)
+        if key is None:
+            key = raw.lower().strip()
+            # Feature names are a small fixed set; don't let junk grow the cache.
+            if len(self._known_features) < 64:
+                self._known_features[raw] = key
+        return key
 
     def _is_feature_enabled(self, feature: str, trainer_id: str | None) -> bool:
-        if trainer_id and trainer_id in self._latest_settings_by_trainer:
-            return bool(self._latest_settings_by_trainer[trainer_id].get(feature))
+        settings = self._latest_settings_by_trainer.get(trainer_id) if trainer_id else None
+        if settings is not None:
+            return bool(settings.get(feature))
 
         return bool(self._latest_settings.get(feature))
 
@@ -571,24 +810,19 @@ class RemoteServerInterface:
         in the queue for later consumption by their corresponding loops.
         """
 
-        feature = feature.lower().strip()
-        queue_ref = self._feature_queues.get(feature)
-        if not queue_ref:
+        trainer_queues = self._feature_queues.get(self._feature_key(feature))
+        if not trainer_queues:
             return []
 
-        matched: list[dict[str, Any]] = []
-        inspected = 0
-        queue_len = len(queue_ref)
-
-        # Only scan the current length to avoid starvation if producers are busy.
-        while inspected < queue_len and len(matched) < limit:
-            evt = queue_ref.popleft()
-            inspected += 1
-
-            from_client = str(evt.get("from_client") or "")
-            if trainer_id is None or from_client == str(trainer_id):
-                matched.append(evt)
-            else:
-                queue_ref.append(evt)
+        if trainer_id is None:
+            # Snapshot: the decode worker may add trainers while we drain.
+            queues = tuple(trainer_queues.values())
+        else:
+            queue_ref = trainer_queues.get(str(trainer_id))
+            queues = (queue_ref,) if queue_ref else ()
 
+        matched: list[dict[str, Any]] = []
+        for queue_ref in queues:
+            while queue_ref and len(matched) < limit:
+                matched.append(queue_ref.popleft())
         return matched
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Mapping, Sequence
 
-from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc_server import ThreadingOSCUDPServer
+from pythonosc import osc_bundle_builder, osc_message_builder, osc_packet
 from pythonosc.udp_client import SimpleUDPClient
 
 from collections import deque
+import heapq
+import itertools
+import logging
+import socket
+import struct
 import threading
 import time
 
+logger = logging.getLogger(__name__)
+
+_PARAM_PREFIX = "/avatar/parameters/"
+
+# Largest UDP payload; VRChat packets are far smaller.
+_MAX_DATAGRAM = 65535
+
+# Span of the "messages_last_10s" status figure.
+_RATE_WINDOW_SECONDS = 10
+
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+
+def _osc_string(text: str) -> bytes:
+    """Encode ``text`` as a null-terminated OSC string padded to 4 bytes."""
+
+    data = text.encode() + b"\0"
+    return data + b"\0" * (-len(data) % 4)
+
 
 class VRChatOSCInterface:
     """Interface to VRChat OSC parameters.
@@ -37,13 +61,14 @@ class VRChatOSCInterface:
         # OSC port.
         self._role = role
 
-        self._lock = threading.Lock()
-        self._message_times = deque()
-        self._expected_trainer_params:  set[str] = {
+        # [epoch second, messages received in it] for the last few seconds,
+        # so the status rate stays exact however busy the avatar gets.
+        self._message_counts: deque[list[int]] = deque(maxlen=_RATE_WINDOW_SECONDS + 1)
+        self._expected_trainer_params: frozenset[str] = frozenset({
             "Trainer/Menu/Shock",
             "Trainer/Menu/Vibrate",
-        }
-        self._expected_pet_params: set[str] = {
+        })
+        self._expected_pet_params: frozenset[str] = frozenset({
             "Trainer/Proximity",
             "Trainer/ProximityHead",
             "Trainer/EyeLeft",
@@ -72,15 +97,26 @@ class VRChatOSCInterface:
             "OGB/Orf/Pussy/PenOthers",
             "OGB/Orf/Ass/PenOthers",
             "OGB/Orf/Mouth/PenOthers",
-        }
+        })
+        self._relevant_params = self._expected_trainer_params | self._expected_pet_params
         self._param_values: dict[str, object] = {}
 
         self._log_relevant_events = log_relevant_events
 
         self._tx_client = None
-
-        self._server = None
-        self._thread = None
+        self._tx_sock: socket.socket | None = None
+        # Encoded address + type tag per (parameter, tag) for hand-built sends.
+        self._osc_templates: dict[tuple[str, str], bytes] = {}
+
+        # Pending pulse resets as (deadline, seq, name, value_off), served by
+        # one worker thread that exits once the queue stays empty.
+        self._pulse_cond = threading.Condition()
+        self._pulse_resets: list[tuple[float, int, str, object]] = []
+        self._pulse_seq = itertools.count()
+        self._pulse_thread: threading.Thread | None = None
+
+        self._rx_sock: socket.socket | None = None
+        self._thread: threading.Thread | None = None
         self._listen_error: str | None = None
 
     def start(self) -> None:
@@ -90,13 +126,11 @@ class VRChatOSCInterface:
 
         self._listen_error = None
 
-        dispatcher = Dispatcher()
-        dispatcher.map("/*", self._on_osc_message)
-        dispatcher.set_default_handler(self._on_osc_message)
-
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
-            server = ThreadingOSCUDPServer((self._host, self._port), dispatcher)
+            sock.bind((self._host, self._port))
         except OSError as exc:
+            sock.close()
             self._listen_error = (
                 f"OSC listener failed to bind {self._host}:{self._port} ({exc})."
                 " Another OSC app may already be using this port."
@@ -104,10 +138,10 @@ class VRChatOSCInterface:
             self._log_message(self._log_relevant_events, self._listen_error)
             return
 
-        self._server = server
+        self._rx_sock = sock
         self._running = True
 
-        thread = threading.Thread(target=server.serve_forever, name="VRChatOSC", daemon=True)
+        thread = threading.Thread(target=self._receive_loop, args=(sock,), name="VRChatOSC", daemon=True)
         self._thread = thread
         thread.start()
 
@@ -122,12 +156,22 @@ class VRChatOSCInterface:
             self.send_parameter("Collar", False)
 
         self._running = False
-        server = self._server
-        self._server = None
-        if server is not None:
-            server.shutdown()
-            server.server_close()
+        sock, thread = self._rx_sock, self._thread
+        self._rx_sock = None
         self._thread = None
+        if sock is None:
+            return
+
+        # Wake the blocking recv with an empty datagram so the loop sees the
+        # stop flag, then release the port.
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as waker:
+                waker.sendto(b"", (self._host, self._port))
+        except OSError:
+            pass
+        if thread is not None:
+            thread.join(timeout=1.0)
+        sock.close()
 
     # Outbound helpers ------------------------------------------------
     def _ensure_tx_client(self):
@@ -137,9 +181,28 @@ class VRChatOSCInterface:
             return self._tx_client
 
         self._tx_client = SimpleUDPClient(self._host, self._tx_port)
+        self._tx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
         return self._tx_client
 
+    def _encode_parameter(self, name: str, value: object) -> bytes | None:
+        """Build an OSC message for bool/int32/float values, else ``None``."""
+
+        if isinstance(value, bool):
+            tag, arg = ("T" if value else "F"), b""
+        elif isinstance(value, int) and _INT32_MIN <= value <= _INT32_MAX:
+            tag, arg = "i", struct.pack(">i", value)
+        elif isinstance(value, float):
+            tag, arg = "f", struct.pack(">f", value)
+        else:
+            return None
+
+        head = self._osc_templates.get((name, tag))
+        if head is None:
+            head = _osc_string(_PARAM_PREFIX + name) + _osc_string("," + tag)
+            self._osc_templates[(name, tag)] = head
+        return head + arg
+
     def send_parameter(self, name: str, value: object) -> bool:
         """Send a single avatar parameter to the local VRChat client.
 
@@ -151,12 +214,41 @@ class VRChatOSCInterface:
         if client is None:
             return False
 
-        address = f"/avatar/parameters/{name}"
+        address = _PARAM_PREFIX + name
 
-        client.send_message(address, value)
+        packet = self._encode_parameter(name, value)
+        if packet is not None and self._tx_sock is not None:
+            self._tx_sock.sendto(packet, (self._host, self._tx_port))
+        else:
+            client.send_message(address, value)
         self._log_message(self._log_relevant_events, f"OSC send {address} value={value}")
         return True
 
+    def send_parameters(self, updates: Mapping[str, object]) -> bool:
+        """Send several avatar parameters as one OSC bundle.
+
+        Returns ``True`` when the bundle was queued successfully.
+        """
+
+        if len(updates) == 1:
+            [(name, value)] = updates.items()
+            return self.send_parameter(name, value)
+
+        client = self._ensure_tx_client()
+        if client is None or not updates:
+            return False
+
+        bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        for name, value in updates.items():
+            message = osc_message_builder.OscMessageBuilder(address=_PARAM_PREFIX + name)
+            message.add_arg(value)
+            bundle.add_content(message.build())
+
+        client.send(bundle.build())
+        for name, value in updates.items():
+            self._log_message(self._log_relevant_events, f"OSC send {_PARAM_PREFIX}{name} value={value}")
+        return True
+
     def pulse_parameter(
         self,
         name: str,
@@ -178,53 +270,122 @@ class VRChatOSCInterface:
         if duration <= 0:
             return
 
-        def _reset() -> None:
-            time.sleep(duration)
-            self.send_parameter(name, value_off)
+        deadline = time.monotonic() + duration
+        with self._pulse_cond:
+            heapq.heappush(self._pulse_resets, (deadline, next(self._pulse_seq), name, value_off))
+            if self._pulse_thread is None:
+                self._pulse_thread = threading.Thread(target=self._run_pulse_resets, name="OSCPulse", daemon=True)
+                self._pulse_thread.start()
+            self._pulse_cond.notify()
 
-        threading.Thread(target=_reset, name=f"OSCPulse:{name}", daemon=True).start()
+    def _run_pulse_resets(self) -> None:
+        try:
+            while (resets := self._next_pulse_resets()) is not None:
+                try:
+                    self.send_parameters(resets)
+                except Exception:
+                    logger.exception("OSC pulse reset failed for %s", ", ".join(resets))
+        finally:
+            # Normally cleared on idle by _next_pulse_resets; this covers an
+            # unexpected exit so the next pulse starts a fresh worker.
+            with self._pulse_cond:
+                if self._pulse_thread is threading.current_thread():
+                    self._pulse_thread = None
+
+    def _next_pulse_resets(self) -> dict[str, object] | None:
+        """Block until resets are due and return all of them; ``None`` once idle."""
+
+        with self._pulse_cond:
+            while True:
+                if not self._pulse_resets:
+                    self._pulse_cond.wait(timeout=5.0)
+                    if not self._pulse_resets:
+                        self._pulse_thread = None
+                        return None
+                    continue
+                now = time.monotonic()
+                delay = self._pulse_resets[0][0] - now
+                if delay > 0:
+                    self._pulse_cond.wait(timeout=delay)
+                    continue
+                due: dict[str, object] = {}
+                while self._pulse_resets and self._pulse_resets[0][0] <= now:
+                    _, _, name, value_off = heapq.heappop(self._pulse_resets)
+                    due[name] = value_off
+                return due
 
     # Internal helpers -------------------------------------------------
+    def _receive_loop(self, sock: socket.socket) -> None:
+        """Read datagrams on a dedicated thread and dispatch them inline.
+
+        One blocking ``recv`` per packet, with no per-packet handler thread
+        or dispatcher lookup in between.
+        """
+
+        while self._running:
+            try:
+                data = sock.recv(_MAX_DATAGRAM)
+            except OSError:
+                if not self._running:
+                    return
+                logger.exception("OSC receive failed")
+                continue
+            if not data:
+                continue
+            try:
+                self._dispatch_packet(data)
+            except Exception:
+                logger.exception("OSC packet dropped")
+
+    def _dispatch_packet(self, data: bytes) -> None:
+        # VRChat only sends immediate messages, so bundle time tags are ignored.
+        try:
+            packet = osc_packet.OscPacket(data)
+        except osc_packet.ParseError:
+            return
+        for timed_msg in packet.messages:
+            self._on_osc_message(timed_msg.message.address, *timed_msg.message.params)
+
     def _on_osc_message(self, address: str, *values: object) -> None:
         """Default handler for all incoming OSC messages."""
-        import time
-
-        now = time.time()
-        cutoff = now - 10.0
 
         param_name: str | None = None
         is_relevant_param = False
 
-        with self._lock:
-            self._message_times.append(now)
-            while self._message_times and self._message_times[0] < cutoff:
-                self._message_times.popleft()
+        # No lock: this thread is the only writer, deque.append and a single
+        # dict store are atomic under the GIL, and readers only take C-level
+        # snapshots of these containers.
+        second = int(time.time())
+        counts = self._message_counts
+        if counts and counts[-1][0] == second:
+            counts[-1][1] += 1
+        else:
+            counts.append([second, 1])
 
-            prefix_all = "/avatar/parameters/"
-            if address.startswith(prefix_all):
-                param_name = address[len(prefix_all) :]
-                value = values[0] if values else None
-                self._param_values[param_name] = value
-                is_relevant_param = self._is_relevant_param(param_name)
+        stripped = address.removeprefix(_PARAM_PREFIX)
+        if len(stripped) != len(address):
+            param_name = stripped
+            value = values[0] if values else None
+            self._param_values[param_name] = value
+            is_relevant_param = self._is_relevant_param(param_name)
 
         self._log_osc_message(address, values, is_relevant_param)
 
     # Public diagnostics -----------------------------------------------
     def get_status_snapshot(self) -> dict:
         """Return a snapshot of recent OSC message and parameter status."""
-        now = time.time()
-        cutoff = now - 10.0
+        # Whole-second buckets: the current second plus the nine before it.
+        cutoff = int(time.time()) - _RATE_WINDOW_SECONDS
 
-        with self._lock:
-            while self._message_times and self._message_times[0] < cutoff:
-                self._message_times.popleft()
-            messages_last_10s = len(self._message_times)
+        message_counts = list(self._message_counts)
 
-            expected_trainer = set(self._expected_trainer_params)
-            seen_trainer = {name for name in self._param_values.keys() if name in expected_trainer}
+        expected_trainer = self._expected_trainer_params
+        seen_trainer = self._param_values.keys() & expected_trainer
 
-            expected_pet = set(self._expected_pet_params)
-            seen_pet = {name for name in self._param_values.keys() if name in expected_pet}
+        expected_pet = self._expected_pet_params
+        seen_pet = self._param_values.keys() & expected_pet
+
+        messages_last_10s = sum(count for second, count in message_counts if second > cutoff)
 
         found_trainer = len(seen_trainer)
         missing_trainer = sorted(expected_trainer - seen_trainer)
@@ -250,12 +411,19 @@ class VRChatOSCInterface:
         The ``name`` should be the suffix after ``/avatar/parameters/``,
         for example ``\"LeftEar_IsGrabbed\"`` or ``\"Tail_Stretch\"``.
         """
-        with self._lock:
-            return self._param_values.get(name, default)
+        return self._param_values.get(name, default)
 
     def get_bool_param(self, name: str, default: object | None = None) -> bool:
         """Interpret an OSC parameter as a boolean."""
-        raw = self.get_parameter(name, default)
+        return self._coerce_bool(self.get_parameter(name, default))
+
+    def get_bool_params(self, names: Sequence[str], defaults: Iterable[object | None]) -> list[bool]:
+        """Return :meth:`get_bool_param` for each of ``names`` with matching ``defaults``."""
+        values = self._param_values
+        return [self._coerce_bool(values.get(name, default)) for name, default in zip(names, defaults)]
+
+    @staticmethod
+    def _coerce_bool(raw: object | None) -> bool:
         if raw is None:
             return False
 
@@ -273,7 +441,15 @@ class VRChatOSCInterface:
 
     def get_float_param(self, name: str, default: object | None = None) -> float:
         """Interpret an OSC parameter as a float in the 0–1 range."""
-        raw = self.get_parameter(name, default)
+        return self._coerce_float(self.get_parameter(name, default))
+
+    def get_float_params(self, names: Sequence[str], default: object | None = None) -> list[float]:
+        """Return :meth:`get_float_param` for each of ``names`` in one pass."""
+        values = self._param_values
+        return [self._coerce_float(values.get(name, default)) for name in names]
+
+    @staticmethod
+    def _coerce_float(raw: object | None) -> float:
         if raw is None:
             return 0.0
 
@@ -293,7 +469,7 @@ class VRChatOSCInterface:
         return max(0.0, min(1.0, value))
 
     def _is_relevant_param(self, param_name: str) -> bool:
-        return param_name in self._expected_trainer_params or param_name in self._expected_pet_params
+        return param_name in self._relevant_params
 
     def _format_osc_line(self, address: str, values: Iterable[object]) -> str:
         if not values:
@@ -306,6 +482,7 @@ class VRChatOSCInterface:
             logger(message)
 
     def _log_osc_message(self, address: str, values: Iterable[object], is_relevant: bool) -> None:
-        if is_relevant:
-            line = self._format_osc_line(address, values)
-            self._log_message(self._log_relevant_events, line)
+        logger = self._log_relevant_events
+        if logger is None or not is_relevant:
+            return
+        logger(self._format_osc_line(address, values))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import os
 import queue
 import sys
@@ -8,7 +9,9 @@ import time
 import warnings
 import logging
 import sounddevice as sd
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from faster_whisper import WhisperModel
@@ -17,6 +20,17 @@ _SHARED_WHISPER_MODEL: Any = None
 _SHARED_WHISPER_BACKEND: Optional[str] = None
 _SHARED_WHISPER_MODEL_LOCK = threading.Lock()
 
+# Transcript chunks kept in memory; older ones are evicted as new text arrives.
+_MAX_TRANSCRIPT_CHUNKS = 2048
+
+# Seconds of captured audio buffered ahead of the worker. Generous so audio
+# is not dropped while Whisper is temporarily slower than real time.
+_AUDIO_BUFFER_SECONDS = 60
+
+# Finished clips waiting for transcription; the oldest is dropped when the
+# model falls behind so audio gating never stalls.
+_CLIP_QUEUE_SIZE = 4
+
 
 @dataclass
 class _TranscriptChunk:
@@ -26,6 +40,49 @@ class _TranscriptChunk:
     timestamp: float = field(default_factory=time.time)
 
 
+class _AudioRing:
+    """Fixed-capacity ring of mono float32 samples.
+
+    ``head`` and ``tail`` are absolute sample counts, so the number of
+    unread samples is always ``tail - head``. Writes that do not fit are
+    truncated rather than overwriting unread audio.
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        self._buf = buffer
+        self._capacity = int(buffer.size)
+        self.head = 0
+        self.tail = 0
+
+    def available(self) -> int:
+        return self.tail - self.head
+
+    def write(self, samples: Any) -> int:
+        count = min(int(samples.size), self._capacity - self.available())
+        start = self.tail % self._capacity
+        first = min(count, self._capacity - start)
+        self._buf[start : start + first] = samples[:first]
+        self._buf[: count - first] = samples[first:count]
+        self.tail += count
+        return count
+
+    def read_into(self, out: Any) -> Any:
+        """Fill ``out`` with the oldest unread samples and consume them."""
+
+        count = int(out.size)
+        start = self.head % self._capacity
+        first = min(count, self._capacity - start)
+        out[:first] = self._buf[start : start + first]
+        out[first:] = self._buf[: count - first]
+        self.head += count
+        return out
+
+    def drop_incomplete(self, window: int) -> None:
+        """Discard the newest unread samples that do not fill a whole ``window``."""
+
+        self.tail -= self.available() % window
+
+
 class WhisperInterface:
     """Interface for running a local Whisper speech-to-text engine.
 
@@ -45,25 +102,36 @@ class WhisperInterface:
         self.input_device = input_device
         self._running = False
 
-        # Background worker thread and coordination primitives.
+        # Background threads and coordination primitives: one gates captured
+        # audio into clips, the other runs Whisper on finished clips.
         self._thread: Optional[threading.Thread] = None
+        self._transcribe_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
-        # Queue of raw audio blocks captured from the microphone.
-        # Use an unbounded queue so we never drop audio when Whisper
-        # is temporarily slower than real time; this prevents missing
-        # transcript chunks during continuous speech.
-        self._audio_queue: "queue.Queue[bytes]" = queue.Queue()
-
-        # Transcript storage: ordered list of chunks.
-        self._transcript: List[_TranscriptChunk] = []
-
-        # Per-tag cursors: index into self._transcript for each feature tag.
+        # Ring of captured samples written directly by the audio callback;
+        # created by the worker once numpy is available.
+        self._audio_ring: Optional[_AudioRing] = None
+        self._ring_lock = threading.Lock()
+        # Set by the callback once a full analysis window is buffered.
+        self._audio_ready = threading.Event()
+        # Whether the worker is building a clip; while it is not, the callback
+        # drops clearly silent blocks instead of buffering them.
+        self._clip_active = False
+
+        # Transcript storage: ordered, bounded window of recent chunks.
+        self._transcript: deque[_TranscriptChunk] = deque(maxlen=_MAX_TRANSCRIPT_CHUNKS)
+        # Total chunks ever appended; cursors are absolute against this count
+        # so they stay valid when old chunks are evicted.
+        self._chunks_appended = 0
+
+        # Per-tag cursors: absolute chunk number each feature tag has read up to.
         self._tag_positions: Dict[str, int] = {}
 
         # Lazy-loaded external dependencies; set during start().
         self._whisper_model = None
         self._backend_label: Optional[str] = None
+        # Index of ``input_device`` in sounddevice's device list; set in start().
+        self._device_index: Optional[int] = None
 
         # Lock to protect transcript/tag structures.
         self._lock = threading.Lock()
@@ -81,6 +149,11 @@ class WhisperInterface:
         if self._running:
             return
 
+        self._device_index = self._find_input_device_index()
+        if self._device_index is None:
+            logging.error("Couldn't find selected audio device %r; Whisper not started", self.input_device)
+            return
+
         # Suppress known deprecation warning emitted by ctranslate2 via
         # faster_whisper about ``pkg_resources`` being deprecated.
         warnings.filterwarnings(
@@ -102,11 +175,14 @@ class WhisperInterface:
                 # variables, but default to CPU to avoid CUDA/cuDNN issues on
                 # machines without a full GPU toolchain installed.
                 device = os.environ.get("WHISPER_DEVICE", "cuda")
-                compute_type = os.environ.get("WHISPER_COMPUTE_TYPE")
+                # Default to int8 weights (with float16 activations on CUDA)
+                # to cut model memory traffic versus float16/float32.
+                compute_type = os.environ.get("WHISPER_COMPUTE_TYPE") or (
+                    "int8_float16" if device == "cuda" else "int8"
+                )
                 if device:
                     kwargs["device"] = device
-                if compute_type:
-                    kwargs["compute_type"] = compute_type
+                kwargs["compute_type"] = compute_type
 
                 backend_label = self._format_backend_label(device, compute_type)
 
@@ -122,7 +198,18 @@ class WhisperInterface:
         self._backend_label = _SHARED_WHISPER_BACKEND
 
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._worker_loop, name="WhisperWorker", daemon=True)
+        # Finished clips handed from the gating thread to the transcriber;
+        # ``None`` tells the transcriber to exit. Each start() gets its own
+        # queue so threads from an earlier run that outlived stop() cannot
+        # pick up or feed this run's clips.
+        clips: queue.Queue[Any] = queue.Queue(maxsize=_CLIP_QUEUE_SIZE)
+        self._transcribe_thread = threading.Thread(
+            target=self._transcribe_loop, args=(clips,), name="WhisperTranscribe", daemon=True
+        )
+        self._transcribe_thread.start()
+        self._thread = threading.Thread(
+            target=self._audio_gating_loop, args=(clips,), name="WhisperWorker", daemon=True
+        )
         self._thread.start()
 
         self._running = True
@@ -135,16 +222,16 @@ class WhisperInterface:
         self._running = False
         self._stop_event.set()
 
-        thread = self._thread
-        if thread is not None:
-            thread.join(timeout=2.0)
+        for thread in (self._thread, self._transcribe_thread):
+            if thread is not None:
+                thread.join(timeout=2.0)
 
         # Best-effort cleanup.
         self._thread = None
-        with self._lock:
-            # Reset the audio queue; see __init__ for rationale on
-            # using an unbounded queue.
-            self._audio_queue = queue.Queue()
+        self._transcribe_thread = None
+        with self._ring_lock:
+            self._audio_ring = None
+        self._audio_ready.clear()
 
     def get_backend_summary(self) -> str:
         """Return a human-friendly summary of the active backend.
@@ -162,6 +249,16 @@ class WhisperInterface:
             return "Unavailable"
         return "Running"
 
+    def _find_input_device_index(self) -> Optional[int]:
+        """Return the index of the first device named ``input_device``."""
+
+        try:
+            devices = sd.query_devices()
+        except Exception:
+            logging.exception("Audio device enumeration failed")
+            return None
+        return next((device["index"] for device in devices if device["name"] == self.input_device), None)
+
     # ------------------------------------------------------------------
     # Whisper model/cache helpers
     # ------------------------------------------------------------------
@@ -247,16 +344,15 @@ class WhisperInterface:
             raise ValueError("tag must be a non-empty string")
 
         with self._lock:
+            end_index = self._chunks_appended
             # Initialise the cursor if this is a new tag.
-            if tag not in self._tag_positions:
-                self._tag_positions[tag] = len(self._transcript)
-
-            start_index = self._tag_positions[tag]
-            end_index = len(self._transcript)
+            start_index = self._tag_positions.setdefault(tag, end_index)
             if start_index >= end_index:
                 return ""
 
-            chunks = self._transcript[start_index:end_index]
+            # Chunks evicted before the tag caught up are skipped.
+            first_kept = end_index - len(self._transcript)
+            chunks = list(islice(self._transcript, max(0, start_index - first_kept), None))
             self._tag_positions[tag] = end_index
 
         return " ".join(chunk.text for chunk in chunks).strip()
@@ -267,7 +363,7 @@ class WhisperInterface:
             raise ValueError("tag must be a non-empty string")
 
         with self._lock:
-            self._tag_positions[tag] = len(self._transcript)
+            self._tag_positions[tag] = self._chunks_appended
 
     def get_recent_text_chunks(self, count: int = 1) -> List[str]:
         """Return up to ``count`` most recent transcript chunks (newest last).
@@ -279,20 +375,20 @@ class WhisperInterface:
             return []
 
         with self._lock:
-            return [chunk.text for chunk in self._transcript[-count:]]
+            start = max(0, len(self._transcript) - count)
+            return [chunk.text for chunk in islice(self._transcript, start, None)]
 
     # ------------------------------------------------------------------
     # Background worker
     # ------------------------------------------------------------------
-    def _worker_loop(self) -> None:
-        """Capture audio and feed it to Whisper in a loop.
+    def _audio_gating_loop(self, clips: queue.Queue[Any]) -> None:
+        """Capture audio and cut it into clips for the transcriber.
 
-        This is intentionally conservative and simple: it records short
-        fixed-length buffers, transcribes them synchronously, and
-        appends non-empty text to the transcript list.
+        Speech is detected with a simple energy gate; a clip ends after a
+        second of silence or when it reaches the maximum length, and is then
+        queued for :meth:`_transcribe_loop` so gating carries on while
+        Whisper runs.
         """
-        model = self._whisper_model
-
         samplerate = 16000
         analysis_window = 1.0  # seconds per silence/energy check
         silence_timeout = 1.0  # seconds of silence to end the clip
@@ -301,15 +397,6 @@ class WhisperInterface:
         chunk_samples = int(samplerate * analysis_window)
         max_clip_samples = int(samplerate * max_clip_duration)
 
-        all_devices = sd.query_devices()
-        selected_devices = [device for device in all_devices if device['name'] == self.input_device]
-        if selected_devices:
-            # TODO: Select the first one.
-            device_index = selected_devices[0]['index']
-        else:
-            msg = "Couldn't find selected audio device"
-            raise RuntimeError(msg)
-
         min_rms_env = os.environ.get("WHISPER_MIN_RMS")
         try:
             min_rms = float(min_rms_env) if min_rms_env is not None else 0.005
@@ -319,146 +406,191 @@ class WhisperInterface:
         try:  # pragma: no cover - environment/hardware specific
             import numpy as np  # type: ignore[import-not-found]
 
-            pending_audio = np.empty(0, dtype="float32")
-            clip_buffers: List["np.ndarray"] = []
+            # Preallocated buffers reused for every window and clip: captured
+            # audio not yet analysed, the current analysis window, and the
+            # clip being built for transcription.
+            with self._ring_lock:
+                self._audio_ring = _AudioRing(np.empty(samplerate * _AUDIO_BUFFER_SECONDS, dtype="float32"))
+            window = np.empty(chunk_samples, dtype="float32")
+            clip_audio = np.empty(max_clip_samples, dtype="float32")
             clip_samples = 0
-            clip_active = False
+            self._clip_active = False
             silent_duration = 0.0
 
             def reset_clip_state() -> None:
-                nonlocal clip_buffers, clip_samples, clip_active, silent_duration
-                clip_buffers = []
+                nonlocal clip_samples, silent_duration
                 clip_samples = 0
-                clip_active = False
+                self._clip_active = False
                 silent_duration = 0.0
 
-            def transcribe_clip() -> None:
-                nonlocal clip_buffers
-                if not clip_buffers:
-                    reset_clip_state()
-                    return
-
-                try:
-                    audio = np.concatenate(clip_buffers)
-                except Exception:
-                    reset_clip_state()
-                    return
-
+            def queue_clip() -> None:
+                # Copy out of the clip buffer: it is reused for the next clip
+                # while this one is still waiting for the transcriber.
+                audio = clip_audio[:clip_samples].copy()
                 reset_clip_state()
 
-                if audio.size == 0:
-                    return
-
-                try:
-                    # faster_whisper returns an iterator of segments and an
-                    # info object. We concatenate the recognised text of all
-                    # segments into a single string.
-                    try:
-                        segments, _info = model.transcribe(audio, vad_filter=True, language="en")
-                    except TypeError:
-                        segments, _info = model.transcribe(audio, language="en")
-                except Exception:
-                    return
-
-                collected_parts: List[str] = []
-                try:
-                    for segment in segments:
-                        part = getattr(segment, "text", "") or ""
-                        part = part.strip()
-                        if part:
-                            collected_parts.append(part)
-                except Exception:
-                    return
-
-                text = " ".join(collected_parts).strip()
-                if not text:
-                    return
-
-                with self._lock:
-                    self._transcript.append(_TranscriptChunk(text=text))
+                if audio.size:
+                    self._enqueue_clip(clips, audio)
 
             with sd.InputStream(
                 samplerate=samplerate,
                 channels=1,
                 dtype="float32",
-                device=device_index,
+                device=self._device_index,
                 blocksize=0,
-                callback=self._make_audio_callback(),
+                callback=self._make_audio_callback(chunk_samples, min_rms),
             ):
                 # Main loop: build up clips with silence gating and length limits.
                 while not self._stop_event.is_set():
-                    try:
-                        data = self._audio_queue.get(timeout=0.1)
-                    except queue.Empty:
-                        continue
-
-                    try:
-                        audio_chunk = np.frombuffer(data, dtype="float32")
-                    except Exception:
+                    if not self._audio_ready.wait(timeout=0.1):
                         continue
-
-                    if audio_chunk.size == 0:
-                        continue
-
-                    if pending_audio.size == 0:
-                        pending_audio = audio_chunk
-                    else:
-                        pending_audio = np.concatenate([pending_audio, audio_chunk])
+                    self._audio_ready.clear()
 
                     # Process audio in 1-second chunks to detect speech and silence.
-                    while pending_audio.size >= chunk_samples and not self._stop_event.is_set():
-                        chunk = pending_audio[:chunk_samples]
-                        pending_audio = pending_audio[chunk_samples:]
+                    while not self._stop_event.is_set() and self._read_window(window):
+                        chunk = window
 
                         try:
-                            rms = float(np.sqrt(np.mean(np.square(chunk), dtype="float64")))
+                            # Dot product fuses square+sum without a temporary array.
+                            rms = math.sqrt(float(chunk @ chunk) / chunk.size)
                         except Exception:
                             rms = 0.0
 
-                        if not clip_active:
+                        if not self._clip_active:
                             # Drop leading silence in 1 second windows until speech is detected.
                             if rms < min_rms:
                                 continue
-                            clip_active = True
+                            self._clip_active = True
                             silent_duration = 0.0
 
                         if rms < min_rms:
                             silent_duration += analysis_window
                             if silent_duration >= silence_timeout:
-                                transcribe_clip()
+                                queue_clip()
                                 break
                         else:
                             silent_duration = 0.0
 
                         remaining_samples = max_clip_samples - clip_samples
                         if remaining_samples <= 0:
-                            transcribe_clip()
+                            queue_clip()
                             # Reprocess the current chunk as the start of the next clip.
-                            pending_audio = np.concatenate([chunk, pending_audio])
-                            break
+                            if rms < min_rms:
+                                continue
+                            self._clip_active = True
+                            remaining_samples = max_clip_samples
 
                         if chunk.size > remaining_samples:
                             chunk = chunk[:remaining_samples]
 
-                        clip_buffers.append(chunk)
+                        clip_audio[clip_samples : clip_samples + chunk.size] = chunk
                         clip_samples += chunk.size
 
                         if clip_samples >= max_clip_samples:
-                            transcribe_clip()
+                            queue_clip()
                             break
 
                 # Flush any in-progress clip if we exit the loop naturally.
-                if clip_buffers:
-                    transcribe_clip()
+                if clip_samples:
+                    queue_clip()
         except Exception:
             logging.exception("Unexpected exception occurred")
             # If audio capture fails (no device, permission issue, etc.),
             # just exit the worker loop; the interface will stay alive
             # but no text will be produced.
+        finally:
+            self._enqueue_clip(clips, None)
+
+    @staticmethod
+    def _enqueue_clip(clips: queue.Queue[Any], audio: Any) -> None:
+        """Queue a clip for transcription, dropping the oldest when full."""
+
+        while True:
+            try:
+                clips.put_nowait(audio)
+                return
+            except queue.Full:
+                pass
+            try:
+                clips.get_nowait()
+                logging.debug("Whisper is falling behind; dropped the oldest queued clip")
+            except queue.Empty:
+                pass
+
+    def _transcribe_loop(self, clips: queue.Queue[Any]) -> None:
+        """Run Whisper on queued clips until the gating thread signals exit."""
+
+        while True:
+            audio = clips.get()
+            if audio is None:
+                return
+            self._transcribe_clip(audio)
+
+    def _transcribe_clip(self, audio: Any) -> None:
+        """Transcribe one clip and append any recognised text."""
+
+        model = self._whisper_model
+        try:
+            # faster_whisper returns an iterator of segments and an
+            # info object. We concatenate the recognised text of all
+            # segments into a single string.
+            try:
+                # Clips are already energy-gated, so skip the second
+                # Silero VAD pass and use greedy decoding.
+                segments, _info = model.transcribe(
+                    audio,
+                    vad_filter=False,
+                    language="en",
+                    beam_size=1,
+                    best_of=1,
+                    condition_on_previous_text=False,
+                )
+            except TypeError:
+                segments, _info = model.transcribe(audio, language="en")
+        except Exception:
             return
 
-    def _make_audio_callback(self):
-        """Create a sounddevice callback that pushes audio into the queue."""
+        collected_parts: List[str] = []
+        try:
+            for segment in segments:
+                part = getattr(segment, "text", "") or ""
+                part = part.strip()
+                if part:
+                    collected_parts.append(part)
+        except Exception:
+            return
+
+        text = " ".join(collected_parts).strip()
+        if not text:
+            return
+
+        with self._lock:
+            self._transcript.append(_TranscriptChunk(text=text))
+            self._chunks_appended += 1
+
+    def _read_window(self, window: Any) -> bool:
+        """Fill ``window`` from the capture ring if enough audio is buffered."""
+
+        with self._ring_lock:
+            ring = self._audio_ring
+            if ring is None or ring.available() < window.size:
+                return False
+            ring.read_into(window)
+        return True
+
+    def _make_audio_callback(self, ready_samples: int, min_rms: float):
+        """Create a sounddevice callback that writes audio into the ring."""
+
+        # Early-out threshold sits well below the worker's gate (hysteresis)
+        # so only blocks the worker would certainly discard are dropped.
+        silence_mean_square = (min_rms * 0.5) ** 2
+        # After any loud block keep buffering one full window so the worker
+        # can judge it, even for speech shorter than a window.
+        hold_samples = 0
+        # Whether blocks were buffered since the last time the callback
+        # started dropping; the partial window they leave behind is cleared
+        # then so it is not stitched onto the next utterance.
+        buffered = False
 
         def _callback(indata, frames, time_info, status):  # pragma: no cover - realtime/audio
             if status:
@@ -466,12 +598,30 @@ class WhisperInterface:
                 # advanced implementation we might log them to the UI.
                 pass
 
-            try:
-                # Copy the underlying buffer so it remains valid after
-                # the callback returns.
-                self._audio_queue.put_nowait(indata.copy().tobytes())
-            except queue.Full:
-                # Drop audio if we're too far behind.
-                pass
+            nonlocal hold_samples, buffered
+            samples = indata[:, 0]
+            if float(samples @ samples) >= silence_mean_square * samples.size:
+                hold_samples = ready_samples
+            elif self._clip_active or hold_samples > 0:
+                hold_samples -= samples.size
+            else:
+                if buffered:
+                    buffered = False
+                    with self._ring_lock:
+                        if self._audio_ring is not None:
+                            self._audio_ring.drop_incomplete(ready_samples)
+                return
+            buffered = True
+
+            # Copy into the ring so the data stays valid after the callback
+            # returns; audio that does not fit is dropped (we're too far behind).
+            with self._ring_lock:
+                ring = self._audio_ring
+                if ring is None:
+                    return
+                ring.write(samples)
+                ready = ring.available() >= ready_samples
+            if ready:
+                self._audio_ready.set()
 
         return _callback
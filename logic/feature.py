@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import functools
+import heapq
+import itertools
+import logging
+import re
 import threading
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Type, TYPE_CHECKING
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type, TYPE_CHECKING
 
 from logic.logging_utils import SessionLogManager
 
@@ -10,6 +16,133 @@ if TYPE_CHECKING:
     from logic.pet.feature import PetFeature
     from logic.trainer.feature import TrainerFeature
 
+# Runs of anything that is not a letter or digit (underscore included).
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalise_text(text: str) -> str:
+    return _NON_WORD_RE.sub(" ", text.lower()).strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _normalise_words(words: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(normalised for word in words if (normalised := Feature.normalise_text(word)))
+
+
+@dataclass(eq=False)
+class _ScheduledTick:
+    """A feature tick registered with :class:`FeatureScheduler`."""
+
+    tick: Callable[[], float | None]
+    interval: float
+    name: str
+    running: bool = False
+    cancelled: bool = False
+    # Set by wake() while the tick runs, so it is rescheduled immediately.
+    woken: bool = False
+    # Set once the tick is out of the scheduler and will not run again.
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class FeatureScheduler:
+    """Run feature ticks on a small shared pool of worker threads.
+
+    Registered ticks sit in a heap keyed by their next due time. A free
+    worker pops the earliest due tick, runs it once and puts it back
+    ``interval`` seconds after it returns, so a feature never ticks on two
+    threads at once. A tick may return a different delay for its next run,
+    e.g. to back off while idle, and :meth:`wake` brings it forward again.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._max_workers = max_workers
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, _ScheduledTick]] = []
+        self._seq = itertools.count()
+        self._workers: list[threading.Thread] = []
+
+    def schedule(self, tick: Callable[[], float | None], interval: float, name: str) -> _ScheduledTick:
+        """Start running ``tick`` now and then every ``interval`` seconds."""
+
+        job = _ScheduledTick(tick=tick, interval=interval, name=name)
+        with self._cond:
+            self._push(job, time.monotonic())
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._run_worker, name=f"FeatureScheduler-{len(self._workers)}", daemon=True
+                )
+                self._workers.append(worker)
+                worker.start()
+        return job
+
+    def cancel(self, job: _ScheduledTick, timeout: float = 1.0) -> None:
+        """Stop rescheduling ``job`` and wait for an in-flight tick to finish."""
+
+        with self._cond:
+            job.cancelled = True
+            if not job.running and not job.done.is_set():
+                self._heap = [entry for entry in self._heap if entry[2] is not job]
+                heapq.heapify(self._heap)
+                job.done.set()
+        job.done.wait(timeout)
+
+    def wake(self, job: _ScheduledTick) -> None:
+        """Run ``job`` as soon as a worker is free instead of at its due time."""
+
+        with self._cond:
+            if job.cancelled or job.done.is_set():
+                return
+            if job.running:
+                job.woken = True
+                return
+            self._heap = [entry for entry in self._heap if entry[2] is not job]
+            heapq.heapify(self._heap)
+            self._push(job, time.monotonic())
+
+    def _push(self, job: _ScheduledTick, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._seq), job))
+        self._cond.notify()
+
+    def _next_due(self) -> _ScheduledTick:
+        with self._cond:
+            while True:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                job = heapq.heappop(self._heap)[2]
+                job.running = True
+                return job
+
+    def _run_worker(self) -> None:
+        while True:
+            job = self._next_due()
+            failed = False
+            delay = None
+            try:
+                delay = job.tick()
+            except Exception:
+                logging.exception("Feature tick %s failed; stopping it", job.name)
+                failed = True
+
+            with self._cond:
+                job.running = False
+                if job.cancelled or failed:
+                    job.done.set()
+                    continue
+                if job.woken:
+                    job.woken = False
+                    delay = 0.0
+                self._push(job, time.monotonic() + (job.interval if delay is None else delay))
+
+
+_SCHEDULER = FeatureScheduler()
+
+
 class Feature:
     """Base feature with common interface wiring and logging."""
 
@@ -34,11 +167,13 @@ class Feature:
         self.server = server
         self.config_provider = config_provider
 
-        self._logger = log_manager.get_logger(f"{self.feature_name}_feature.log")
+        self._logger = log_manager.get_logger(f"{self.feature_name}_feature.log") if log_manager is not None else None
 
         self._running: bool = False
-        self._thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
+        self._job: _ScheduledTick | None = None
+        # Delay between ticks while no trainer has the feature enabled; a
+        # settings change from the server wakes the feature early.
+        self._idle_poll_interval: float = 5.0
 
         self._poll_interval: float = 0.1
         self._cooldown_until: float = 0.0
@@ -50,6 +185,10 @@ class Feature:
         self._base_shock_strength_min: float = 10
         self._base_shock_strength_max: float = 50
 
+        # Last trainer settings snapshot as (monotonic timestamp, configs);
+        # shared by the repeated lookups within one worker tick.
+        self._settings_cache: tuple[float, Dict[str, Mapping[str, Any]]] | None = None
+
         self.option_handlers = {
             key: getattr(self, handler_name)
             for key, handler_name in self.option_handlers.items()
@@ -63,33 +202,34 @@ class Feature:
         if not text:
             return ""
 
-        chars: list[str] = []
-        for ch in text.lower():
-            if ch.isalnum():
-                chars.append(ch)
-            elif ch.isspace():
-                chars.append(" ")
-            else:
-                chars.append(" ")
-
-        return " ".join("".join(chars).split())
+        # Cached: Whisper often repeats short phrases between polls.
+        return _normalise_text(text)
 
     @staticmethod
     def normalise_list(words: list[str] | None) -> list[str]:
-        return [Feature.normalise_text(word) for word in (words or []) if Feature.normalise_text(word)]
+        if not words:
+            return []
+
+        # Word lists come from trainer settings and rarely change between
+        # polls, so whole lists are cached by their contents.
+        return list(_normalise_words(tuple(words)))
 
     # Lifecycle helpers -------------------------------------------------
-    def _start_worker(self, *, target: Callable[[], None], name: str) -> None:
+    def _start_worker(self, *, target: Callable[[], float | None], name: str) -> None:
+        """Run ``target`` every poll interval on the shared feature scheduler.
+
+        ``target`` may return a delay to use before its next run instead.
+        """
         if self._running:
             return
 
         self._running = True
-        self._stop_event.clear()
         self.whisper.reset_tag(self.feature_name)
 
-        thread = threading.Thread(target=target, name=name, daemon=True)
-        self._thread = thread
-        thread.start()
+        self._job = _SCHEDULER.schedule(target, self._poll_interval, name)
+        if self.server is not None:
+            self.server.add_settings_listener(self._on_settings_changed)
+            self.server.add_feature_event_listener(self.feature_name, self._wake)
 
         self._log("start")
 
@@ -98,21 +238,37 @@ class Feature:
             return
 
         self._running = False
-        self._stop_event.set()
+        if self.server is not None:
+            self.server.remove_settings_listener(self._on_settings_changed)
+            self.server.remove_feature_event_listener(self.feature_name, self._wake)
 
-        thread = self._thread
-        if thread is not None:
-            thread.join(timeout=1.0)
-        self._thread = None
+        job = self._job
+        if job is not None:
+            _SCHEDULER.cancel(job, timeout=1.0)
+        self._job = None
 
         self._log("stop")
 
+    def _on_settings_changed(self) -> None:
+        self._settings_cache = None
+        self._wake()
+
+    def _wake(self) -> None:
+        """Run the next tick now, e.g. because new input has arrived."""
+        job = self._job
+        if job is not None:
+            _SCHEDULER.wake(job)
+
     # Logging -----------------------------------------------------------
     def _log(self, message: str) -> None:
+        if self._logger is None:
+            return
         self._logger.log(message)
 
     # Config helpers ----------------------------------------------------
-    def _config_map(self) -> Dict[str, dict]:
+    # Configs handed to features are shared, not copied: features only read
+    # them and must never mutate them.
+    def _config_map(self) -> Dict[str, Mapping[str, Any]]:
         provider = self.config_provider
         if provider is None:
             return {}
@@ -122,25 +278,30 @@ class Feature:
         except Exception:
             return {}
 
-        if not isinstance(configs, dict):
+        if not isinstance(configs, Mapping):
             return {}
 
-        clean_configs: dict[str, dict] = {}
-        for cid, cfg in configs.items():
-            if isinstance(cfg, dict):
-                clean_configs[str(cid)] = dict(cfg)
-
-        return clean_configs
+        return {str(cid): cfg for cid, cfg in configs.items() if isinstance(cfg, Mapping)}
 
-    def _extract_word_list(self, config: dict, key: str) -> list[str]:
-        values = config.get(key) if isinstance(config, dict) else None
+    def _extract_word_list(self, config: Mapping[str, Any], key: str) -> list[str]:
+        values = config.get(key) if isinstance(config, Mapping) else None
         return self.normalise_list(values)
 
     @property
     def option_config_key(self) -> str | None:
         return f"{self.feature_name}_option"
 
-    def _latest_trainer_settings(self) -> Dict[str, dict]:
+    def _latest_trainer_settings(self) -> Dict[str, Mapping[str, Any]]:
+        now = time.monotonic()
+        cached = self._settings_cache
+        if cached is not None and now - cached[0] < self._poll_interval * 0.5:
+            return cached[1]
+
+        configs = self._load_trainer_settings()
+        self._settings_cache = (now, configs)
+        return configs
+
+    def _load_trainer_settings(self) -> Dict[str, Mapping[str, Any]]:
         configs = self._config_map()
         if configs:
             return configs
@@ -151,36 +312,26 @@ class Feature:
 
         raw_configs = getattr(server, "latest_settings_by_trainer", None)
         configs = raw_configs() if callable(raw_configs) else raw_configs
-        if not isinstance(configs, dict):
+        if not isinstance(configs, Mapping):
             return {}
 
-        clean_configs: dict[str, dict] = {}
-        for trainer_id, cfg in configs.items():
-            if isinstance(cfg, dict):
-                clean_configs[str(trainer_id)] = dict(cfg)
-
-        return clean_configs
+        # The server already hands out read-only views, so no copy is needed.
+        return {str(trainer_id): cfg for trainer_id, cfg in configs.items() if isinstance(cfg, Mapping)}
 
     # Scaling helpers ---------------------------------------------------
     @staticmethod
-    def _scaling_from_config(config: dict) -> dict[str, float]:
-        def _safe(key: str) -> float:
-            try:
-                val = float(config.get(key, 1.0))
-            except Exception:
-                val = 1.0
-            return max(0.0, min(2.0, val))
-
-        return {
-            "delay_scale": _safe("delay_scale"),
-            "cooldown_scale": _safe("cooldown_scale"),
-            "duration_scale": _safe("duration_scale"),
-            "strength_scale": _safe("strength_scale"),
-        }
+    def _scale_factor(config: dict, key: str) -> float:
+        try:
+            val = float(config.get(key, 1.0))
+        except Exception:
+            val = 1.0
+        return max(0.0, min(2.0, val))
 
     def _scaled_value(self, base: float, config: dict, scale_key: str) -> float:
-        scaling = self._scaling_from_config(config)
-        return max(0.0, base * scaling.get(scale_key, 1.0))
+        # Only the one factor needed is parsed, not the whole scaling dict.
+        # Bases are non-negative and factors are clamped to [0, 2], so the
+        # product needs no further clamping.
+        return base * self._scale_factor(config, scale_key)
 
     def _scaled_cooldown(self, config: dict) -> float:
         base = self._base_cooldown_seconds
@@ -199,11 +350,11 @@ class Feature:
         return self._scaled_value(base, config, "strength_scale")
 
     def _scaled_strength_range(self, config: dict) -> tuple[float, float]:
-        scaling = self._scaling_from_config(config)
+        strength_scale = self._scale_factor(config, "strength_scale")
         base_min = self._base_shock_strength_min
         base_max = self._base_shock_strength_max
-        shock_min = max(0.0, base_min * scaling["strength_scale"])
-        shock_max = max(shock_min, base_max * scaling["strength_scale"])
+        shock_min = base_min * strength_scale
+        shock_max = max(shock_min, base_max * strength_scale)
         return shock_min, shock_max
 
     def _shock_params_single(self, config: dict) -> tuple[float, float]:
@@ -246,6 +397,8 @@ class FeatureDefinition:
     ui_column: int = 0
     ui_dropdown: bool = False
     show_in_ui: bool = True
+    # Option keys, read from the feature class on first use.
+    _option_values: tuple[str, ...] | None = field(default=None, init=False, repr=False)
 
     def resolve_class(self, role: str) -> Type[Feature] | None:
         if role == "trainer":
@@ -266,9 +419,12 @@ class FeatureDefinition:
         if not self.ui_dropdown:
             return []
 
-        cls: Type[Feature] | None = self.trainer_cls or self.pet_cls
-        handlers = getattr(cls, "option_handlers", None)
-        return list(handlers.keys())
+        if self._option_values is None:
+            # ``option_handlers`` is a class attribute, so no instance is needed.
+            cls: Type[Feature] | None = self.trainer_cls or self.pet_cls
+            handlers = getattr(cls, "option_handlers", None) or {}
+            self._option_values = tuple(handlers.keys())
+        return list(self._option_values)
 
     def build_feature(self, role: str, context: FeatureContext) -> Feature | None:
         cls = self.resolve_class(role)
@@ -287,6 +443,12 @@ class FeatureDefinition:
 
 def feature_definitions() -> List[FeatureDefinition]:
     """Return all feature definitions for both trainer and pet roles."""
+    return list(_feature_definitions())
+
+
+@functools.lru_cache(maxsize=1)
+def _feature_definitions() -> tuple[FeatureDefinition, ...]:
+    """Build the feature definitions once; the feature modules import lazily."""
     from logic.pet.depth import DepthFeature
     from logic.pet.focus import FocusFeature
     from logic.pet.forbidden import ForbiddenWordsFeature
@@ -302,7 +464,7 @@ def feature_definitions() -> List[FeatureDefinition]:
     from logic.trainer.scolding import TrainerScoldingFeature
     from logic.trainer.tricks import TrainerTricksFeature
 
-    return [
+    return (
         FeatureDefinition(
             key="focus",
             label="Focus",
@@ -358,18 +520,18 @@ def feature_definitions() -> List[FeatureDefinition]:
             ui_column=1,
             ui_dropdown=True,
         ),
-    ]
+    )
 
 
 def feature_list() -> List[str]:
     """Return feature config keys used for boolean enablement."""
-    return [definition.key for definition in feature_definitions()]
+    return [definition.key for definition in _feature_definitions()]
 
 
 def feature_option_keys() -> List[str]:
     """Return option config keys for dropdown-enabled features."""
     keys: list[str] = []
-    for definition in feature_definitions():
+    for definition in _feature_definitions():
         option_key = definition.option_key
         if option_key:
             keys.append(option_key)
@@ -379,7 +541,7 @@ def feature_option_keys() -> List[str]:
 def feature_option_defaults() -> Dict[str, str]:
     """Return default option selections keyed by option config key."""
     defaults: dict[str, str] = {}
-    for definition in feature_definitions():
+    for definition in _feature_definitions():
         option_key = definition.option_key
         values = definition.option_values()
         if option_key and values:
@@ -389,14 +551,15 @@ def feature_option_defaults() -> Dict[str, str]:
 
 def ui_feature_definitions() -> List[FeatureDefinition]:
     """Return feature definitions intended for UI toggle construction."""
-    return [definition for definition in feature_definitions() if definition.show_in_ui]
+    return [definition for definition in _feature_definitions() if definition.show_in_ui]
+
+
+@functools.lru_cache(maxsize=None)
+def _definitions_for_role(role: str) -> tuple[FeatureDefinition, ...]:
+    """Return the definitions that have a feature class for ``role``."""
+    return tuple(definition for definition in _feature_definitions() if definition.resolve_class(role) is not None)
 
 
 def build_features_for_role(role: str, context: FeatureContext) -> List[Feature]:
     """Instantiate all features matching a given role."""
-    instances: List[Feature] = []
-    for definition in feature_definitions():
-        feature = definition.build_feature(role, context)
-        if feature is not None:
-            instances.append(feature)
-    return instances
+    return [definition.build_feature(role, context) for definition in _definitions_for_role(role)]
@@ -1,10 +1,29 @@
 from __future__ import annotations
 
+import atexit
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import threading
-from typing import Dict, Iterable, List
+import time
+from typing import BinaryIO, Dict, Iterable, List
+
+# (epoch second, formatted local time) for the most recent log timestamp.
+_stamp_cache: tuple[int, str] = (-1, "")
+
+
+def _log_timestamp() -> str:
+    """Return the local time as ``YYYY-MM-DD HH:MM:SS.mmm`` for log lines."""
+
+    global _stamp_cache
+    now = time.time()
+    second = int(now)
+    # Read the shared tuple once: another thread may replace it at any time.
+    cached_second, text = _stamp_cache
+    if cached_second != second:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _stamp_cache = (second, text)
+    return f"{text}.{int((now - second) * 1000):03d}"
 
 
 @dataclass
@@ -13,19 +32,37 @@ class LogFile:
 
     path: Path
     _lock: threading.Lock = field(default_factory=threading.Lock)
+    # Opened on first write and kept open. Unbuffered binary append, so each
+    # entry is encoded once and reaches disk in a single write.
+    _handle: BinaryIO | None = field(default=None, init=False, repr=False)
 
     def log(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        line = f"[{timestamp}] {message}\n"
-
+        line = f"[{_log_timestamp()}] {message}\n".encode("utf-8")
+
+        with self._lock:
+            try:
+                if self._handle is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._handle = self.path.open("ab", buffering=0)
+                self._handle.write(line)
+            except Exception:
+                # Logging should never break the main application flow; drop
+                # the handle so the next entry retries with a fresh one.
+                self._close_handle()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def _close_handle(self) -> None:
+        handle = self._handle
+        self._handle = None
+        if handle is None:
+            return
         try:
-            with self._lock:
-                self.path.parent.mkdir(parents=True, exist_ok=True)
-                with self.path.open("a", encoding="utf-8") as handle:
-                    handle.write(line)
+            handle.close()
         except Exception:
-            # Logging should never break the main application flow.
-            return
+            pass
 
 
 class SessionLogManager:
@@ -44,6 +81,13 @@ class SessionLogManager:
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
         self._loggers: Dict[str, LogFile] = {}
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Close every log file opened by this session."""
+
+        for logger in list(self._loggers.values()):
+            logger.close()
 
     def get_logger(self, filename: str) -> LogFile:
         if filename not in self._loggers:
@@ -20,37 +20,31 @@ class DepthFeature(PetFeature):
         super().__init__(**kwargs)
 
         self._depth_threshold: float = 0.9
-        self._targets = [
+        self._targets = (
             "OGB/Orf/Pussy/PenOthers",
             "OGB/Orf/Ass/PenOthers",
             "OGB/Orf/Mouth/PenOthers",
-        ]
+        )
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetDepthFeature")
+        self._start_worker(target=self._tick, name="PetDepthFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
+    def _tick(self) -> float | None:
         """Background loop that watches depth parameters."""
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
+        active = self._first_active_trainer_config()
+        if active is None:
+            return self._idle_poll_interval
 
-            config = list(self._active_trainer_configs().values())[0]
+        _, config = active
 
-            for base in self._targets:
-                depth = self.osc.get_float_param(base, 0)
+        depths = self.osc.get_float_params(self._targets, 0)
+        for base, depth in zip(self._targets, depths):
+            if depth > 0:
+                self._log_sample({"orifice": base, "depth": depth})
 
-                if depth > 0:
-                    self._log_sample({"orifice": base, "depth": depth})
-
-                if depth >= self._depth_threshold:
-                    self._deliver_shock_range(config=config, reason=base, value=depth, threshold=self._depth_threshold)
-
-            if self._stop_event.wait(self._poll_interval):
-                break
+            if depth >= self._depth_threshold:
+                self._deliver_shock_range(config=config, reason=base, value=depth, threshold=self._depth_threshold)
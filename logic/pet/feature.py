@@ -20,11 +20,22 @@ class PetFeature(Feature):
         configs = self._latest_trainer_settings()
         return {tid: cfg for tid, cfg in configs.items() if cfg.get(self.feature_name)}
 
+    def _first_active_trainer_config(self) -> tuple[str, dict] | None:
+        """Return ``(trainer_id, config)`` for the first trainer enabling this feature."""
+        for tid, cfg in self._latest_trainer_settings().items():
+            if cfg.get(self.feature_name):
+                return tid, cfg
+        return None
+
     def _has_active_trainer(self) -> bool:
-        return bool(self._active_trainer_configs())
+        return self._first_active_trainer_config() is not None
 
     def _log_sample(self, stats: dict) -> None:
-        now = time.time()
+        # Skip building the sample line entirely when nothing is logged.
+        if self._logger is None:
+            return
+
+        now = time.monotonic()
 
         if now - self._last_sample_log < 1.0:
             return
@@ -37,7 +48,7 @@ class PetFeature(Feature):
         )
 
     def _check_cooldown(self, config: dict) -> bool:
-        now = time.time()
+        now = time.monotonic()
         if now < self._cooldown_until:
             return False
 
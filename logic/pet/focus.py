@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Dict, List
 
 from logic.pet.feature import PetFeature
@@ -14,6 +15,16 @@ class FocusFeature(PetFeature):
 
     feature_name = "focus"
 
+    # OSC parameters that count as paying attention, with their defaults.
+    _FOCUS_KEYS = (
+        "Trainer/EyeLeft",
+        "Trainer/EyeFarLeft",
+        "Trainer/EyeRight",
+        "Trainer/EyeFarRight",
+        "Trainer/ProximityHead",
+    )
+    _FOCUS_DEFAULTS = (True, False, True, False, False)
+
     def __init__(
         self,
         **kwargs,
@@ -28,49 +39,38 @@ class FocusFeature(PetFeature):
         self._last_tick: float = 0
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetFocusFeature")
+        self._start_worker(target=self._tick, name="PetFocusFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        import time
-
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
-
-            now = time.time()
+    def _tick(self) -> float | None:
+        active = self._first_active_trainer_config()
+        if active is None:
+            return self._idle_poll_interval
 
-            config = list(self._active_trainer_configs().values())[0]
+        now = time.monotonic()
 
-            penalties = self._collect_focus_events()
-            self._apply_penalties(penalties)
+        _, config = active
 
-            dt = max(0.0, now - self._last_tick)
-            self._update_meter(dt)
-            self._last_tick = now
+        penalties = self._collect_focus_events()
+        self._apply_penalties(penalties)
 
-            if self._should_shock():
-                self._deliver_shock_range(config=config, reason="focus_low", value=self._focus_meter, threshold=self._focus_shock_threshold, inverse=True)
+        dt = max(0.0, now - self._last_tick)
+        self._update_meter(dt)
+        self._last_tick = now
 
-            self._log_sample({"meter": self._focus_meter, "threshold": self._focus_shock_threshold})
+        if self._should_shock():
+            self._deliver_shock_range(config=config, reason="focus_low", value=self._focus_meter, threshold=self._focus_shock_threshold, inverse=True)
 
-            if self._stop_event.wait(self._poll_interval):
-                break
+        self._log_sample({"meter": self._focus_meter, "threshold": self._focus_shock_threshold})
 
     def _collect_focus_events(self) -> Dict[str, List[dict]]:
         return self.server.poll_feature_events(self.feature_name, limit=10)
 
     def _update_meter(self, dt: float) -> None:
-        focused = self.osc.get_bool_param("Trainer/EyeLeft", default=True) \
-          or self.osc.get_bool_param("Trainer/EyeFarLeft", default=False) \
-          or self.osc.get_bool_param("Trainer/EyeRight", default=True) \
-          or self.osc.get_bool_param("Trainer/EyeFarRight", default=False) \
-          or self.osc.get_bool_param("Trainer/ProximityHead", default=False)
+        focused = any(self.osc.get_bool_params(self._FOCUS_KEYS, self._FOCUS_DEFAULTS))
         delta = (self._fill_rate if focused else -self._drain_rate) * dt
         self._focus_meter = max(0.0, min(1.0, self._focus_meter + delta))
 
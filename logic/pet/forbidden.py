@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import re
 import time
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple, Union
 
 from logic.pet.feature import PetFeature
 
+# Phrase lists shorter than this are scanned with plain substring checks,
+# which beat a regex alternation for a handful of phrases.
+_SMALL_PHRASE_LIST = 8
+
+# Either longest-first phrases to test one by one, or a compiled alternation.
+_Matcher = Union[Tuple[str, ...], "re.Pattern[str]"]
+
 
 @dataclass
 class _TrainerForbiddenState:
@@ -23,48 +31,60 @@ class ForbiddenWordsFeature(PetFeature):
 
     feature_name = "forbidden_words"
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        # Per-trainer compiled matcher, rebuilt only when the phrase list changes.
+        self._matchers: Dict[str, Tuple[Tuple[str, ...], _Matcher]] = {}
+
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetForbiddenWordsFeature")
+        self._start_worker(target=self._tick, name="PetForbiddenWordsFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                self.whisper.reset_tag(self.feature_name)
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
+    def _tick(self) -> float | None:
+        active_configs = self._active_trainer_configs()
+        if not active_configs:
+            self.whisper.reset_tag(self.feature_name)
+            return self._idle_poll_interval
 
-            text = self.whisper.get_new_text(self.feature_name)
-            normalised_text = self.normalise_text(text)
+        text = self.whisper.get_new_text(self.feature_name)
+        normalised_text = self.normalise_text(text)
 
-            if not normalised_text:
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
-
-            active_configs = self._active_trainer_configs()
+        if not normalised_text:
+            return
 
-            for trainer_id, config in active_configs.items():
-                phrases = self.normalise_list(config.get(self.feature_name, []))
+        for trainer_id, config in active_configs.items():
+            phrases = self.normalise_list(config.get(self.feature_name, []))
 
-                if not phrases:
-                    continue
-
-                match = self._match_forbidden(normalised_text, phrases)
+            if not phrases:
+                continue
 
-                if match:
-                    self._deliver_shock_single(config=config, reason=match, trainer_id=trainer_id)
-                    break
+            match = self._match_forbidden(normalised_text, self._matcher_for(trainer_id, phrases))
 
-            if self._stop_event.wait(self._poll_interval):
+            if match:
+                self._deliver_shock_single(config=config, reason=match, trainer_id=trainer_id)
                 break
 
-    def _match_forbidden(self, normalised_text: str, phrases: List[str]) -> str | None:
-        for phrase in phrases:
-            if phrase in normalised_text:
-                return phrase
-        return None
+    def _matcher_for(self, trainer_id: str, phrases: List[str]) -> _Matcher:
+        key = tuple(phrases)
+        cached = self._matchers.get(trainer_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Longest phrases first so overlapping phrases report the fullest match.
+        ordered = tuple(sorted(set(key), key=len, reverse=True))
+        matcher: _Matcher = ordered
+        if len(ordered) >= _SMALL_PHRASE_LIST:
+            matcher = re.compile("|".join(re.escape(phrase) for phrase in ordered))
+        self._matchers[trainer_id] = (key, matcher)
+        return matcher
+
+    def _match_forbidden(self, normalised_text: str, matcher: _Matcher) -> str | None:
+        if isinstance(matcher, tuple):
+            return next((phrase for phrase in matcher if phrase in normalised_text), None)
+
+        match = matcher.search(normalised_text)
+        return match.group(0) if match else None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Dict, List
 
 from logic.pet.feature import PetFeature
@@ -27,53 +28,44 @@ class ProximityFeature(PetFeature):
         self._heel_proximity_target: float = 1
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetProximityFeature")
+        self._start_worker(target=self._tick, name="PetProximityFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        import time
+    def _tick(self) -> float | None:
+        active_configs = self._active_trainer_configs()
+        if not active_configs:
+            return self._idle_poll_interval
 
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
+        now = time.monotonic()
 
-            now = time.time()
+        summon_events = self._collect_events()
 
-            active_configs = self._active_trainer_configs()
+        proximity_value = self.osc.get_float_param("Trainer/Proximity", default=1.0)
 
-            summon_events = self._collect_events()
+        self._log_sample({"proximity": proximity_value})
 
-            proximity_value = self.osc.get_float_param("Trainer/Proximity", default=1.0)
+        for trainer_id, config in active_configs.items():
+            if summon_events.get(trainer_id):
+                self._pending_command_from = trainer_id
+                self._delay_until = now + self._scaled_delay(config)
+                self._log(
+                    f"summon_start trainer={trainer_id[:8]}"
+                )
 
-            self._log_sample({"proximity": proximity_value})
-
-            for trainer_id, config in active_configs.items():
-                if summon_events.get(trainer_id):
-                    self._pending_command_from = trainer_id
-                    self._delay_until = now + self._scaled_delay(config)
+            if self._pending_command_from is not None:
+                if proximity_value >= self._heel_proximity_target:
+                    self._delay_until = None
                     self._log(
-                        f"summon_start trainer={trainer_id[:8]}"
+                        f"summon_success trainer={trainer_id[:8]} proximity={proximity_value:.3f}"
                     )
+                    self._pending_command_from = None
+                elif now >= self._delay_until:
+                    self._deliver_shock_single(config=config, reason="didnt_heel", trainer_id=trainer_id)
 
-                if self._pending_command_from is not None:
-                    if proximity_value >= self._heel_proximity_target:
-                        self._delay_until = None
-                        self._log(
-                            f"summon_success trainer={trainer_id[:8]} proximity={proximity_value:.3f}"
-                        )
-                        self._pending_command_from = None
-                    elif now >= self._delay_until:
-                        self._deliver_shock_single(config=config, reason="didnt_heel", trainer_id=trainer_id)
-
-            config = list(self._active_trainer_configs().values())[0]
-
-            if now >= self._cooldown_until and proximity_value <= self._proximity_threshold:
-                self._deliver_shock_range(config=config, reason="too_far", value=proximity_value, threshold=self._proximity_threshold, min=0, inverse=True)
+        config = next(iter(active_configs.values()))
 
-            if self._stop_event.wait(self._poll_interval):
-                break
+        if now >= self._cooldown_until and proximity_value <= self._proximity_threshold:
+            self._deliver_shock_range(config=config, reason="too_far", value=proximity_value, threshold=self._proximity_threshold, min_val=0, inverse=True)
@@ -22,30 +22,25 @@ class PullFeature(PetFeature):
         self._targets = ("LeftEar", "RightEar", "Tail")
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetPullFeature")
+        self._start_worker(target=self._tick, name="PetPullFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
+    def _tick(self) -> float | None:
         """Background loop that watches ear/tail stretch parameters."""
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
+        active = self._first_active_trainer_config()
+        if active is None:
+            return self._idle_poll_interval
 
-            config = list(self._active_trainer_configs().values())[0]
+        _, config = active
 
-            for base in self._targets:
-                is_grabbed = self.osc.get_bool_param(f"{base}_IsGrabbed")
-                stretch = self.osc.get_float_param(f"{base}_Stretch")
+        for base in self._targets:
+            is_grabbed = self.osc.get_bool_param(f"{base}_IsGrabbed")
+            stretch = self.osc.get_float_param(f"{base}_Stretch")
 
-                if is_grabbed:
-                    self._log_sample({"bone": base, "stretch": stretch})
-                    if stretch >= self._stretch_threshold:
-                        self._deliver_shock_range(config=config, reason=base, value=stretch, threshold=self._stretch_threshold)
-
-            if self._stop_event.wait(self._poll_interval):
-                break
+            if is_grabbed:
+                self._log_sample({"bone": base, "stretch": stretch})
+                if stretch >= self._stretch_threshold:
+                    self._deliver_shock_range(config=config, reason=base, value=stretch, threshold=self._stretch_threshold)
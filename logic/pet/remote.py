@@ -13,31 +13,29 @@ class RemoteFeature(PetFeature):
     feature_name = "remote"
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetRemoteFeature")
+        self._start_worker(target=self._tick, name="PetRemoteFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
-
-            active_configs = self._active_trainer_configs()
-            all_events = self._collect_events()
-
-            for trainer_id, config in active_configs.items():
-                trainer_events = all_events.get(trainer_id)
-                if trainer_events:
-                    for event in trainer_events:
-                        command = event.get("payload").get("command")
-                        if command == "shock":
-                            self._deliver_shock_single(config=config, reason="shock", trainer_id=trainer_id)
-                        elif command == "vibrate":
-                            self._deliver_vibrate_single(config=config, reason="vibrate", trainer_id=trainer_id)
-
-            if self._stop_event.wait(self._poll_interval):
-                break
+    def _tick(self) -> float | None:
+        active_configs = self._active_trainer_configs()
+        if not active_configs:
+            return self._idle_poll_interval
+
+        all_events = self._collect_events()
+
+        for trainer_id, config in active_configs.items():
+            trainer_events = all_events.get(trainer_id)
+            if trainer_events:
+                for event in trainer_events:
+                    command = event.get("payload").get("command")
+                    if command == "shock":
+                        self._deliver_shock_single(config=config, reason="shock", trainer_id=trainer_id)
+                    elif command == "vibrate":
+                        self._deliver_vibrate_single(config=config, reason="vibrate", trainer_id=trainer_id)
+
+        # Purely command driven: new events wake the feature, so only a slow
+        # backstop poll is needed.
+        return self._idle_poll_interval
@@ -17,26 +17,23 @@ class ScoldingFeature(PetFeature):
     feature_name = "scolding"
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetScoldingFeature")
+        self._start_worker(target=self._tick, name="PetScoldingFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
+    def _tick(self) -> float | None:
+        active_configs = self._active_trainer_configs()
+        if not active_configs:
+            return self._idle_poll_interval
 
-            active_configs = self._active_trainer_configs()
+        events_by_trainer = self._collect_events()
 
-            events_by_trainer = self._collect_events()
+        for trainer_id, config in active_configs.items():
+            if events_by_trainer.get(trainer_id):
+                self._deliver_shock_single(config=config, reason="scold", trainer_id=trainer_id)
 
-            for trainer_id, config in active_configs.items():
-                if events_by_trainer.get(trainer_id):
-                    self._deliver_shock_single(config=config, reason="scold", trainer_id=trainer_id)
-
-            if self._stop_event.wait(self._poll_interval):
-                break
+        # Purely command driven: new events wake the feature, so only a slow
+        # backstop poll is needed.
+        return self._idle_poll_interval
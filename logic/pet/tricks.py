@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import time
-from typing import Dict, List
+from itertools import repeat
+from typing import Dict, List, Tuple
 
 from logic.pet.feature import PetFeature
 
@@ -17,6 +18,92 @@ class TricksFeature(PetFeature):
 
     feature_name = "tricks"
 
+    # Accepted poses per trick as (OSC bool parameter, required value) pairs.
+    # A trick is complete when every pair of any one of its poses holds.
+    _TRICK_POSES: Dict[str, Tuple[Tuple[Tuple[str, bool], ...], ...]] = {
+        "paw": (
+            (
+                ("Trainer/HandFloorLeftMin", False),
+                ("Trainer/FootFloorLeftMax", True),
+                ("Trainer/FootFloorRightMax", True),
+                ("Trainer/HipsFloorMax", True),
+                ("Trainer/HeadFloorMin", False),
+            ),
+            (
+                ("Trainer/HandFloorRightMin", False),
+                ("Trainer/FootFloorLeftMax", True),
+                ("Trainer/FootFloorRightMax", True),
+                ("Trainer/HipsFloorMax", True),
+                ("Trainer/HeadFloorMin", False),
+            ),
+        ),
+        "sit": (
+            (
+                ("Trainer/HandFloorLeftMax", True),
+                ("Trainer/HandFloorRightMax", True),
+                ("Trainer/FootFloorLeftMax", True),
+                ("Trainer/FootFloorRightMax", True),
+                ("Trainer/HipsFloorMax", True),
+                ("Trainer/HeadFloorMin", False),
+            ),
+        ),
+        "lay_down": (
+            (
+                ("Trainer/HandFloorLeftMax", True),
+                ("Trainer/HandFloorRightMax", True),
+                ("Trainer/FootFloorLeftMax", True),
+                ("Trainer/FootFloorRightMax", True),
+                ("Trainer/HipsFloorMax", True),
+                ("Trainer/HeadFloorMax", True),
+            ),
+        ),
+        "beg": (
+            (
+                ("Trainer/HandFloorLeftMin", False),
+                ("Trainer/HandFloorRightMin", False),
+                ("Trainer/FootFloorLeftMax", True),
+                ("Trainer/FootFloorRightMax", True),
+                ("Trainer/HipsFloorMax", True),
+                ("Trainer/HeadFloorMin", False),
+            ),
+        ),
+        "play_dead": (
+            (
+                ("Trainer/HandFloorLeftMin", False),
+                ("Trainer/HandFloorRightMin", False),
+                ("Trainer/FootFloorLeftMin", False),
+                ("Trainer/FootFloorRightMin", False),
+                ("Trainer/HipsFloorMax", True),
+                ("Trainer/HeadFloorMax", True),
+            ),
+        ),
+        "roll_over": (
+            (
+                ("Trainer/HandFloorLeftMin", False),
+                ("Trainer/HandFloorRightMin", False),
+                ("Trainer/FootFloorLeftMin", False),
+                ("Trainer/FootFloorRightMin", False),
+                ("Trainer/HipsFloorMax", True),
+                ("Trainer/HeadFloorMax", True),
+            ),
+        ),
+        "present": (
+            (
+                ("Trainer/HandFloorLeftMax", True),
+                ("Trainer/HandFloorRightMax", True),
+                ("Trainer/FootFloorLeftMax", True),
+                ("Trainer/FootFloorRightMax", True),
+                ("Trainer/HipsFloorMin", False),
+                ("Trainer/HeadFloorMax", True),
+            ),
+        ),
+    }
+    # Every parameter a trick's poses read, so they can be fetched in one call.
+    _TRICK_PARAMS: Dict[str, Tuple[str, ...]] = {
+        trick: tuple(dict.fromkeys(param for pose in poses for param, _ in pose))
+        for trick, poses in _TRICK_POSES.items()
+    }
+
     def __init__(
         self,
         **kwargs,
@@ -25,109 +112,70 @@ class TricksFeature(PetFeature):
 
         self._base_delay_seconds: float = 10.0
         self._active_command: str = None
+        # Second completion pulse still to send, as (due time, config, trainer id).
+        self._pending_pulse: Tuple[float, dict, str] | None = None
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetTricksFeature")
+        self._start_worker(target=self._tick, name="PetTricksFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
-
-            now = time.time()
-
-            active_configs = self._active_trainer_configs()
-            command_events = self._collect_events()
-
-            for trainer_id, config in active_configs.items():
-                if self._active_command is None and command_events.get(trainer_id):
-                    self._start_command(now, command_events[trainer_id][0], config, trainer_id)
-
-                if self._active_command is not None:
-                    if self._is_command_completed():
-                        self._log(
-                            f"command_success trainer={trainer_id[:8]} trick={self._active_command} remaining={self._delay_until - now}"
-                        )
-                        self._deliver_task_completion_signal(config=config, trainer_id=trainer_id)
-                        self._active_command = None
-                    elif now >= self._delay_until:
-                        self._deliver_shock_single(config=config, reason=self._active_command, trainer_id=trainer_id)
-
-            if self._stop_event.wait(self._poll_interval):
-                break
+    def _tick(self) -> float | None:
+        now = time.monotonic()
+
+        if self._pending_pulse is not None:
+            due, config, trainer_id = self._pending_pulse
+            if now < due:
+                return due - now
+            self._pending_pulse = None
+            self._deliver_vibrate_single(config=config, reason="task_complete_pulse2", trainer_id=trainer_id)
+
+        active_configs = self._active_trainer_configs()
+        if not active_configs:
+            return self._idle_poll_interval
+
+        command_events = self._collect_events()
+
+        for trainer_id, config in active_configs.items():
+            if self._active_command is None and command_events.get(trainer_id):
+                self._start_command(now, command_events[trainer_id][0], config, trainer_id)
+
+            if self._active_command is not None:
+                if self._is_command_completed():
+                    self._log(
+                        f"command_success trainer={trainer_id[:8]} trick={self._active_command} remaining={self._delay_until - now}"
+                    )
+                    self._deliver_task_completion_signal(config=config, trainer_id=trainer_id)
+                    self._active_command = None
+                elif now >= self._delay_until:
+                    self._deliver_shock_single(config=config, reason=self._active_command, trainer_id=trainer_id)
+
+        if self._pending_pulse is not None:
+            return self._pending_pulse[0] - now
 
     def _start_command(self, now: float, event: dict, config: dict, trainer_id: str) -> None:
         command = event.get("payload").get("command")
-        self._active_command = command,
+        self._active_command = command
         self._delay_until = now + self._scaled_delay(config)
         self._log(f"command_start trainer={trainer_id[:8]} trick={command}")
         self._deliver_task_start_signal(config, trainer_id)
 
     def _is_command_completed(self) -> bool:
-        command = self._active_command
-        if command == "paw":
-            return (not self.osc.get_bool_param("Trainer/HandFloorLeftMin", default=False) \
-                   or not self.osc.get_bool_param("Trainer/HandFloorRightMin", default=False)) \
-                   and self.osc.get_bool_param("Trainer/FootFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorRightMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HipsFloorMax", default=False) \
-                   and not self.osc.get_bool_param("Trainer/HeadFloorMin", default=False)
-        elif command == "sit":
-            return self.osc.get_bool_param("Trainer/HandFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HandFloorRightMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorRightMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HipsFloorMax", default=False) \
-                   and not self.osc.get_bool_param("Trainer/HeadFloorMin", default=False)
-        elif command == "lay_down":
-            return self.osc.get_bool_param("Trainer/HandFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HandFloorRightMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorRightMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HipsFloorMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HeadFloorMax", default=False)
-        elif command == "beg":
-            return not self.osc.get_bool_param("Trainer/HandFloorLeftMin", default=False) \
-                   and not self.osc.get_bool_param("Trainer/HandFloorRightMin", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorRightMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HipsFloorMax", default=False) \
-                   and not self.osc.get_bool_param("Trainer/HeadFloorMin", default=False)
-        elif command == "play_dead":
-            return not self.osc.get_bool_param("Trainer/HandFloorLeftMin", default=False) \
-                   and not self.osc.get_bool_param("Trainer/HandFloorRightMin", default=False) \
-                   and not self.osc.get_bool_param("Trainer/FootFloorLeftMin", default=False) \
-                   and not self.osc.get_bool_param("Trainer/FootFloorRightMin", default=False) \
-                   and self.osc.get_bool_param("Trainer/HipsFloorMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HeadFloorMax", default=False)
-        elif command == "roll_over":
-            return not self.osc.get_bool_param("Trainer/HandFloorLeftMin", default=False) \
-                   and not self.osc.get_bool_param("Trainer/HandFloorRightMin", default=False) \
-                   and not self.osc.get_bool_param("Trainer/FootFloorLeftMin", default=False) \
-                   and not self.osc.get_bool_param("Trainer/FootFloorRightMin", default=False) \
-                   and self.osc.get_bool_param("Trainer/HipsFloorMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HeadFloorMax", default=False)
-        elif command == "present":
-            return self.osc.get_bool_param("Trainer/HandFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/HandFloorRightMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorLeftMax", default=False) \
-                   and self.osc.get_bool_param("Trainer/FootFloorRightMax", default=False) \
-                   and not self.osc.get_bool_param("Trainer/HipsFloorMin", default=False) \
-                   and self.osc.get_bool_param("Trainer/HeadFloorMax", default=False)
-
-        return False
+        pose_options = self._TRICK_POSES.get(self._active_command)
+        if pose_options is None:
+            return False
+
+        names = self._TRICK_PARAMS[self._active_command]
+        values = dict(zip(names, self.osc.get_bool_params(names, repeat(False))))
+        return any(all(values[param] is expected for param, expected in pose) for pose in pose_options)
 
     def _deliver_task_start_signal(self, config: dict, trainer_id: str) -> None:
         self._deliver_vibrate_single(config=config, reason="task_start", trainer_id=trainer_id)
 
     def _deliver_task_completion_signal(self, config: dict, trainer_id: str) -> None:
-        for pulse in (1, 2):
-            self._deliver_vibrate_single(config=config, reason=f"task_complete_pulse{pulse}", trainer_id=trainer_id)
-            if pulse == 1:
-                time.sleep(0.2)
+        # The second pulse is sent by a later tick rather than sleeping here,
+        # which would hold a shared scheduler thread.
+        self._deliver_vibrate_single(config=config, reason="task_complete_pulse1", trainer_id=trainer_id)
+        self._pending_pulse = (time.monotonic() + 0.2, config, trainer_id)
@@ -1,10 +1,89 @@
 from __future__ import annotations
 
+import re
 import time
-from typing import Callable, Dict, Set
+from typing import Callable, Dict
 
 from logic.pet.feature import PetFeature
 
+# Characters dropped from tokens: punctuation, digits and underscores. Letters,
+# whitespace and straight/curly apostrophes are kept.
+_NON_TOKEN_CHARS = re.compile(r"[^\w\s'’]|[\d_]")
+
+# First-person pronouns for the Pronouns game.
+_DISALLOWED_PRONOUNS = frozenset({
+    "i",
+    "i'm",
+    "i've",
+    "i'll",
+    "me",
+    "my",
+    "mine",
+    "myself",
+})
+
+# Words for the Swear Words game.
+_SWEAR_WORDS = frozenset({
+    "ass",
+    "asshole",
+    "bastard",
+    "bitch",
+    "bullshit",
+    "crap",
+    "cunt",
+    "damn",
+    "dick",
+    "dickhead",
+    "douche",
+    "douchebag",
+    "fuck",
+    "fucker",
+    "fucking",
+    "hell",
+    "motherfucker",
+    "piss",
+    "prick",
+    "shit",
+    "shitty",
+    "slut",
+})
+
+# Words for the Negativity game; apostrophes are stripped before matching.
+_NEGATIVE_TOKENS = frozenset({
+    "no",
+    "not",
+    "never",
+    "none",
+    "nothing",
+    "nowhere",
+    "nobody",
+    "noone",
+    "cannot",
+    "cant",
+    "dont",
+    "wont",
+    "shouldnt",
+    "wouldnt",
+    "couldnt",
+    "isnt",
+    "arent",
+    "wasnt",
+    "werent",
+    "hasnt",
+    "havent",
+    "hadnt",
+    "doesnt",
+    "didnt",
+    "aint",
+    "stop",
+    "bad",
+    "worse",
+    "worst",
+    "hate",
+    "awful",
+    "terrible",
+})
+
 
 class WordFeature(PetFeature):
     """Pet word feature.
@@ -30,42 +109,35 @@ class WordFeature(PetFeature):
         super().__init__(**kwargs)
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="PetWordFeature")
+        self._start_worker(target=self._tick, name="PetWordFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
+    def _tick(self) -> float | None:
         """Background loop that watches Whisper transcripts."""
-        while not self._stop_event.is_set():
-            if not self._has_active_trainer():
-                self.whisper.reset_tag(self.feature_name)
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
-
-            active_configs = self._active_trainer_configs()
+        active_configs = self._active_trainer_configs()
+        if not active_configs:
+            self.whisper.reset_tag(self.feature_name)
+            return self._idle_poll_interval
 
-            text = self.whisper.get_new_text(self.feature_name)
+        text = self.whisper.get_new_text(self.feature_name)
 
-            for trainer_id, config in active_configs.items():
-                if not text:
-                    continue
-
-                handlers = self.option_handlers or {}
-                selected_option = config.get(self.option_config_key)
-                handler = handlers.get(selected_option) if isinstance(handlers, dict) else None
+        for trainer_id, config in active_configs.items():
+            if not text:
+                continue
 
-                if handler is None and isinstance(handlers, dict) and handlers:
-                    # Fall back to the first available option for robustness.
-                    handler = handlers[next(iter(handlers.keys()))]
+            handlers = self.option_handlers or {}
+            selected_option = config.get(self.option_config_key)
+            handler = handlers.get(selected_option) if isinstance(handlers, dict) else None
 
-                if handler is not None:
-                    handler(config, trainer_id, text)
+            if handler is None and isinstance(handlers, dict) and handlers:
+                # Fall back to the first available option for robustness.
+                handler = handlers[next(iter(handlers.keys()))]
 
-            if self._stop_event.wait(self._poll_interval):
-                break
+            if handler is not None:
+                handler(config, trainer_id, text)
 
     @staticmethod
     def _tokenise_text(text: str) -> list[str]:
@@ -73,12 +145,18 @@ class WordFeature(PetFeature):
         if not text:
             return []
 
+        raw_tokens = _NON_TOKEN_CHARS.sub("", text).split()
+        letters = "".join(raw_tokens).replace("'", "").replace("’", "")
+        if not letters or letters.isalpha():
+            # Common case: the regex left only letters and apostrophes.
+            return [token.lower().replace("’", "'") for token in raw_tokens]
+
+        # Rare: numerics outside \d (e.g. "½") survive the regex.
         tokens: list[str] = []
-        for raw_token in text.split():
-            cleaned = "".join(ch for ch in raw_token if ch.isalpha() or ch in ("'", "’")).lower()
-            cleaned = cleaned.replace("’", "'")
-            if cleaned:
-                tokens.append(cleaned)
+        for token in raw_tokens:
+            token = "".join(ch for ch in token if ch.isalpha() or ch in ("'", "’"))
+            if token:
+                tokens.append(token.lower().replace("’", "'"))
         return tokens
 
     def _process_pronouns_text(self, config: dict, trainer_id: str, text: str) -> None:
@@ -108,19 +186,8 @@ class WordFeature(PetFeature):
 
     def _contains_disallowed_pronouns(self, text: str) -> bool:
         """Return True if the text includes first-person pronouns."""
-        disallowed_tokens: Set[str] = {
-            "i",
-            "i'm",
-            "i've",
-            "i'll",
-            "me",
-            "my",
-            "mine",
-            "myself",
-        }
-
         for token in self._tokenise_text(text):
-            if token in disallowed_tokens:
+            if token in _DISALLOWED_PRONOUNS:
                 return True
 
         return False
@@ -130,7 +197,7 @@ class WordFeature(PetFeature):
         """Return True if the text includes the letter 'e' or 'E'."""
         if not text:
             return False
-        return any(ch.lower() == "e" for ch in text if ch.isalpha())
+        return "e" in text or "E" in text
 
     def _contains_contraction(self, text: str) -> bool:
         """Return True if the text contains contractions."""
@@ -140,78 +207,18 @@ class WordFeature(PetFeature):
 
     def _contains_swear_words(self, text: str) -> bool:
         """Return True if the text contains swear words."""
-        swear_words: Set[str] = {
-            "ass",
-            "asshole",
-            "bastard",
-            "bitch",
-            "bullshit",
-            "crap",
-            "cunt",
-            "damn",
-            "dick",
-            "dickhead",
-            "douche",
-            "douchebag",
-            "fuck",
-            "fucker",
-            "fucking",
-            "hell",
-            "motherfucker",
-            "piss",
-            "prick",
-            "shit",
-            "shitty",
-            "slut",
-        }
-
         for token in self._tokenise_text(text):
             collapsed = token.replace("'", "")
-            if token in swear_words or collapsed in swear_words:
+            if token in _SWEAR_WORDS or collapsed in _SWEAR_WORDS:
                 return True
 
         return False
 
     def _contains_negativity(self, text: str) -> bool:
         """Return True if the text contains negative wording."""
-        negative_tokens: Set[str] = {
-            "no",
-            "not",
-            "never",
-            "none",
-            "nothing",
-            "nowhere",
-            "nobody",
-            "noone",
-            "cannot",
-            "cant",
-            "dont",
-            "wont",
-            "shouldnt",
-            "wouldnt",
-            "couldnt",
-            "isnt",
-            "arent",
-            "wasnt",
-            "werent",
-            "hasnt",
-            "havent",
-            "hadnt",
-            "doesnt",
-            "didnt",
-            "aint",
-            "stop",
-            "bad",
-            "worse",
-            "worst",
-            "hate",
-            "awful",
-            "terrible",
-        }
-
         for token in self._tokenise_text(text):
             collapsed = token.replace("'", "")
-            if token in negative_tokens or collapsed in negative_tokens:
+            if token in _NEGATIVE_TOKENS or collapsed in _NEGATIVE_TOKENS:
                 return True
 
         return False
@@ -9,10 +9,15 @@ from logic.feature import (
     feature_option_keys,
 )
 
+# The feature registry is fixed at import time, so read it once here.
+_FEATURE_LIST = tuple(feature_list())
+_OPTION_KEYS = tuple(feature_option_keys())
+_OPTION_DEFAULTS = feature_option_defaults()
+
 TRAINER_SETTINGS_KEYS = [
     "profile",
-    *feature_list(),
-    *feature_option_keys(),
+    *_FEATURE_LIST,
+    *_OPTION_KEYS,
     "delay_scale",
     "cooldown_scale",
     "duration_scale",
@@ -51,11 +56,10 @@ def set_active_profile_name(config: Dict[str, Any], name: str | None) -> None:
 
 def default_profile_settings(profile_name: str) -> Dict[str, Any]:
     """Default settings for a new trainer profile."""
-    option_defaults = feature_option_defaults()
     defaults = {
         "profile": profile_name,
-        **{feature: False for feature in feature_list()},
-        **option_defaults,
+        **dict.fromkeys(_FEATURE_LIST, False),
+        **_OPTION_DEFAULTS,
         "delay_scale": 1.0,
         "cooldown_scale": 1.0,
         "duration_scale": 1.0,
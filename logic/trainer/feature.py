@@ -42,37 +42,31 @@ class TrainerCommandFeature(TrainerFeature):
         self._command_phrases: dict[str, list[str]] = {}
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        while not self._stop_event.is_set():
-            if not self._has_active_pet():
-                self.whisper.reset_tag(self.feature_name)
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
-
-            text = self.whisper.get_new_text(self.feature_name)
+    def _tick(self) -> None:
+        if not self._has_active_pet():
+            self.whisper.reset_tag(self.feature_name)
+            return
 
-            if text:
-                pet_configs = self._config_map()
+        text = self.whisper.get_new_text(self.feature_name)
 
-                for pet_id, cfg in pet_configs.items():
-                    if not cfg.get(self.feature_name):
-                        continue
+        if text:
+            pet_configs = self._config_map()
 
-                    detected = self._detect_command(text, cfg)
-                    if detected is None:
-                        continue
+            for pet_id, cfg in pet_configs.items():
+                if not cfg.get(self.feature_name):
+                    continue
 
-                    meta = {"feature": self.feature_name, "target_client": str(pet_id)}
-                    self.server.send_command(detected, meta)
-                    self._log(
-                        f"command pet={str(pet_id)[:8]} name={detected}"
-                    )
+                detected = self._detect_command(text, cfg)
+                if detected is None:
+                    continue
 
-                    self._pulse_command_flag("Trainer/Command")
+                meta = {"feature": self.feature_name, "target_client": str(pet_id)}
+                self.server.send_command(detected, meta)
+                self._log(
+                    f"command pet={str(pet_id)[:8]} name={detected}"
+                )
 
-            if self._stop_event.wait(self._poll_interval):
-                break
+                self._pulse_command_flag("Trainer/Command")
 
     def _detect_command(self, text: str, cfg: dict) -> str | None:
         if not text:
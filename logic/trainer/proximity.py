@@ -24,7 +24,7 @@ class TrainerProximityFeature(TrainerCommandFeature):
         }
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="TrainerProximityFeature")
+        self._start_worker(target=self._tick, name="TrainerProximityFeature")
 
     def stop(self) -> None:
         self._stop_worker()
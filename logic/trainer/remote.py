@@ -19,36 +19,30 @@ class TrainerRemoteFeature(TrainerFeature):
         self._prev_vibrate: bool = False
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="TrainerProximityFeature")
+        self._start_worker(target=self._tick, name="TrainerProximityFeature")
 
     def stop(self) -> None:
         self._stop_worker()
 
     # Internal helpers -------------------------------------------------
-    def _worker_loop(self) -> None:
-        while not self._stop_event.is_set():
-            if not self._has_active_pet():
-                if self._stop_event.wait(self._poll_interval):
-                    break
-                continue
-
-            pet_configs = self._config_map()
-            for pet_id, cfg in pet_configs.items():
-                if not cfg.get(self.feature_name):
-                    continue
+    def _tick(self) -> None:
+        if not self._has_active_pet():
+            return
 
-                shock_trigger = self.osc.get_bool_param(f"Trainer/Menu/Shock", False)
-                if shock_trigger and not self._prev_shock:
-                    meta = {"feature": self.feature_name, "target_client": str(pet_id)}
-                    self.server.send_command("shock", meta)
+        pet_configs = self._config_map()
+        for pet_id, cfg in pet_configs.items():
+            if not cfg.get(self.feature_name):
+                continue
 
-                vibrate_trigger = self.osc.get_bool_param(f"Trainer/Menu/Vibrate", False)
-                if vibrate_trigger and not self._prev_vibrate:
-                    meta = {"feature": self.feature_name, "target_client": str(pet_id)}
-                    self.server.send_command("vibrate", meta)
+            shock_trigger = self.osc.get_bool_param(f"Trainer/Menu/Shock", False)
+            if shock_trigger and not self._prev_shock:
+                meta = {"feature": self.feature_name, "target_client": str(pet_id)}
+                self.server.send_command("shock", meta)
 
-                self._prev_shock = shock_trigger
-                self._prev_vibrate = vibrate_trigger
+            vibrate_trigger = self.osc.get_bool_param(f"Trainer/Menu/Vibrate", False)
+            if vibrate_trigger and not self._prev_vibrate:
+                meta = {"feature": self.feature_name, "target_client": str(pet_id)}
+                self.server.send_command("vibrate", meta)
 
-            if self._stop_event.wait(self._poll_interval):
-                break
+            self._prev_shock = shock_trigger
+            self._prev_vibrate = vibrate_trigger
@@ -20,7 +20,7 @@ class TrainerScoldingFeature(TrainerCommandFeature):
         self._send_default: bool = True
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="TrainerScoldingFeature")
+        self._start_worker(target=self._tick, name="TrainerScoldingFeature")
 
     def stop(self) -> None:
         self._stop_worker()
@@ -28,7 +28,7 @@ class TrainerTricksFeature(TrainerCommandFeature):
         }
 
     def start(self) -> None:
-        self._start_worker(target=self._worker_loop, name="TrainerTricksFeature")
+        self._start_worker(target=self._tick, name="TrainerTricksFeature")
 
     def stop(self) -> None:
         self._stop_worker()